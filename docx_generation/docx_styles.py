@@ -14,14 +14,28 @@ You can easily modify formatting by:
 See docx-formatting-spec.md for the complete specification.
 """
 
+import functools
+import os
+import re
+import tempfile
+from copy import deepcopy
+from dataclasses import dataclass
+from io import BytesIO
+from xml.sax.saxutils import escape
+
 from docx import Document
-from docx.shared import Pt, Cm, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt, Cm, Emu, Twips, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK, WD_COLOR_INDEX, WD_TAB_ALIGNMENT, WD_TAB_LEADER
 from docx.enum.table import WD_TABLE_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from docx.enum.section import WD_ORIENT
 from docx.oxml import parse_xml
 from docx.oxml.ns import qn
+from docx.oxml.table import CT_Tbl
+from docx.table import Table, _Cell
 from docx.oxml import OxmlElement
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+from lxml import etree
 
 
 # =============================================================================
@@ -32,15 +46,28 @@ from docx.oxml import OxmlElement
 FONT_PRIMARY = 'Aptos'
 FONT_DISPLAY = 'Aptos Display'
 
+
+@functools.lru_cache(maxsize=64)
+def _rgb(r, g, b):
+    """Return a shared RGBColor so repeated palette entries reuse one object."""
+    return RGBColor(r, g, b)
+
+
 # Colours (RGB tuples)
-COLOUR_BLACK = RGBColor(0, 0, 0)
-COLOUR_GREY = RGBColor(128, 128, 128)
-COLOUR_DARK_GREY = RGBColor(64, 64, 64)  # Darker grey for better header readability
-COLOUR_LIGHT_GREY = RGBColor(242, 242, 242)
-COLOUR_CREAM = RGBColor(255, 250, 240)
-COLOUR_YELLOW = RGBColor(255, 255, 0)
-COLOUR_WHITE = RGBColor(255, 255, 255)
-COLOUR_BLUE = RGBColor(68, 114, 196)  # For backwards compatibility with existing tables
+COLOUR_BLACK = _rgb(0, 0, 0)
+COLOUR_GREY = _rgb(128, 128, 128)
+COLOUR_DARK_GREY = _rgb(64, 64, 64)  # Darker grey for better header readability
+COLOUR_LIGHT_GREY = _rgb(242, 242, 242)
+COLOUR_CREAM = _rgb(255, 250, 240)
+COLOUR_YELLOW = _rgb(255, 255, 0)
+COLOUR_WHITE = _rgb(255, 255, 255)
+COLOUR_BLUE = _rgb(68, 114, 196)  # For backwards compatibility with existing tables
+
+# Text highlight colours accepted by add_highlighted_text()
+_HIGHLIGHT_COLOURS = {
+    'yellow': WD_COLOR_INDEX.YELLOW,
+    'grey': WD_COLOR_INDEX.GRAY_25,
+}
 
 # Sizes
 SIZE_TITLE = Pt(20)  # Updated from 18pt per user preference
@@ -75,80 +102,276 @@ SPACING_BEFORE_HEADING = Pt(12)
 SPACING_AFTER_HEADING = Pt(6)
 LINE_SPACING = 1.15
 
+SPACING_NONE = Pt(0)  # Shared by table cells and response-line spacing
+SPACING_AFTER_OPTIONS = Pt(12)  # Between a question's last option and the next question
+
+# Table cells
+CELL_PADDING = Cm(0.19)  # Word default cell padding
+CELL_PADDING_TWIPS = int(CELL_PADDING.twips)  # 108
+QUOTE_PADDING_TWIPS = int(Cm(0.5).twips)
+ANSWER_PADDING_TWIPS = int(Cm(0.3).twips)
+
 # Blank Lines
 BLANK_LINE_HEIGHT = Cm(0.7)
+BLANK_LINE_FIRST_HEIGHT = Cm(0.35)  # Half height to reduce space after question
+
+
+# =============================================================================
+# XML FRAGMENTS - Immutable OOXML snippets, built once at import
+# =============================================================================
+
+_W_NSDECL = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+# Clark-notation attribute names, computed once instead of per qn() call
+_W_W = qn('w:w')
+_W_TYPE = qn('w:type')
+_W_VAL = qn('w:val')
+_W_SZ = qn('w:sz')
+_W_COLOR = qn('w:color')
+_W_FILL = qn('w:fill')
+_W_STYLE_ID = qn('w:styleId')
+_W_ASCII = qn('w:ascii')
+_W_HANSI = qn('w:hAnsi')
+_W_EAST_ASIA = qn('w:eastAsia')
+_W_CS = qn('w:cs')
+_W_SIDES = {side: qn(f'w:{side}') for side in ('top', 'left', 'bottom', 'right')}
+
+# Clark-notation element names used in lookups
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+_W_STYLE = qn('w:style')
+_W_PBDR = qn('w:pBdr')
+_W_CONTEXTUAL_SPACING = qn('w:contextualSpacing')
+_W_RFONTS = qn('w:rFonts')
+_W_RPR = qn('w:rPr')
+_W_DOC_DEFAULTS = qn('w:docDefaults')
+_W_RPR_DEFAULT = qn('w:rPrDefault')
+_W_SECT_PR = qn('w:sectPr')
+_XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+# Table with no borders at all (header layout table, name block)
+_NIL_TBL_BORDERS_XML = (
+    f'<w:tblBorders {_W_NSDECL}>'
+    '<w:top w:val="nil"/>'
+    '<w:left w:val="nil"/>'
+    '<w:bottom w:val="nil"/>'
+    '<w:right w:val="nil"/>'
+    '<w:insideH w:val="nil"/>'
+    '<w:insideV w:val="nil"/>'
+    '</w:tblBorders>'
+)
+
+# Paragraph with no borders at all (Title/Subtitle styles)
+_NIL_PBDR_XML = (
+    f'<w:pBdr {_W_NSDECL}>'
+    '<w:top w:val="nil"/>'
+    '<w:left w:val="nil"/>'
+    '<w:bottom w:val="nil"/>'
+    '<w:right w:val="nil"/>'
+    '<w:between w:val="nil"/>'
+    '<w:bar w:val="nil"/>'
+    '</w:pBdr>'
+)
+
+# w:pPr children that must follow w:pBdr (schema order)
+_PBDR_SUCCESSORS = (
+    'w:shd', 'w:tabs', 'w:suppressAutoHyphens', 'w:kinsoku', 'w:wordWrap',
+    'w:overflowPunct', 'w:topLinePunct', 'w:autoSpaceDE', 'w:autoSpaceDN',
+    'w:bidi', 'w:adjustRightInd', 'w:snapToGrid', 'w:spacing', 'w:ind',
+    'w:contextualSpacing', 'w:mirrorIndents', 'w:suppressOverlap', 'w:jc',
+    'w:textDirection', 'w:textAlignment', 'w:textboxTightWrap',
+    'w:outlineLvl', 'w:divId', 'w:cnfStyle', 'w:rPr', 'w:sectPr', 'w:pPrChange',
+)
+
+# Run properties shared by every header/footer text run (Aptos 10pt, dark grey)
+_HEADER_RUN_RPR_XML = (
+    f'<w:rPr {_W_NSDECL}><w:rFonts w:ascii="{FONT_PRIMARY}" w:hAnsi="{FONT_PRIMARY}"/>'
+    f'<w:color w:val="{COLOUR_DARK_GREY}"/>'
+    f'<w:sz w:val="{int(SIZE_HEADER_FOOTER.pt * 2)}"/></w:rPr>'
+)
+
+# Plain first-page header and default header paragraphs (runs appended per document)
+_HEADER_PARAGRAPH_XML = (
+    f'<w:p {_W_NSDECL}>'
+    '<w:pPr><w:pStyle w:val="Header"/><w:jc w:val="left"/></w:pPr>'
+    '</w:p>'
+)
+# Spacing after (6pt) matches the table-based first-page header
+_DEFAULT_HEADER_PARAGRAPH_XML = (
+    f'<w:p {_W_NSDECL}>'
+    '<w:pPr><w:pStyle w:val="Header"/><w:spacing w:after="120"/><w:jc w:val="left"/></w:pPr>'
+    '</w:p>'
+)
+
+# Footer paragraph: right-aligned PAGE field as begin, instruction and end
+# runs (runs are required for valid OOXML)
+_FOOTER_PARAGRAPH_XML = (
+    f'<w:p {_W_NSDECL}>'
+    '<w:pPr><w:pStyle w:val="Footer"/><w:jc w:val="right"/></w:pPr>'
+    '<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+    '<w:r><w:instrText xml:space="preserve"> PAGE </w:instrText></w:r>'
+    '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+    '</w:p>'
+)
+
+
+# Content/analysis tables, built as one WML string and parsed once per table.
+# Placeholders are filled with str.format(); cell text must be pre-escaped.
+# Cell padding (0.19cm all round) is a table-wide default in w:tblCellMar,
+# which every cell inherits. Vertical alignment has no table-level property,
+# so w:vAlign stays on each cell.
+_TBL_TEMPLATE = (
+    f'<w:tbl {_W_NSDECL}><w:tblPr>'
+    '<w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>{layout}'
+    '<w:tblCellMar>'
+    + ''.join(
+        f'<w:{side} w:w="{CELL_PADDING_TWIPS}" w:type="dxa"/>'
+        for side in ('top', 'left', 'bottom', 'right')
+    )
+    + '</w:tblCellMar>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+    '</w:tblPr><w:tblGrid>{grid}</w:tblGrid>{rows}</w:tbl>'
+)
+_GRID_COL_TEMPLATE = '<w:gridCol w:w="{width}"/>'
+_ROW_TEMPLATE = '<w:tr><w:trPr><w:trHeight w:hRule="auto"/></w:trPr>{cells}</w:tr>'
+# Vertically centred cell holding one single-spaced paragraph
+_CELL_TEMPLATE = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>{shading}'
+    '<w:vAlign w:val="center"/></w:tcPr>'
+    '<w:p><w:pPr><w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>'
+    '{jc}</w:pPr>{run}</w:p></w:tc>'
+)
+# Unformatted cell, as _add_table() creates it
+_EMPTY_CELL_TEMPLATE = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr><w:p/></w:tc>'
+_SHADING_TEMPLATE = '<w:shd w:fill="{fill}"/>'
+_JC_TEMPLATE = '<w:jc w:val="{align}"/>'
+_RUN_SPECIAL_CHARS = re.compile(r'([\t\r\n])')
+
+
+def _tc_borders_element(top=None, left=None, bottom=None, right=None):
+    """
+    Build a ``w:tcBorders`` element directly with lxml, without an XML parse.
+
+    Each side is None for no border, or a (size, colour) pair for a single
+    line. Sides are written in schema order.
+    """
+    tcBorders = OxmlElement('w:tcBorders')
+    for side, line in (('top', top), ('left', left), ('bottom', bottom), ('right', right)):
+        edge = etree.SubElement(tcBorders, _W_SIDES[side])
+        if line is None:
+            edge.set(_W_VAL, 'nil')
+        else:
+            size, colour = line
+            edge.set(_W_VAL, 'single')
+            edge.set(_W_SZ, str(size))
+            edge.set(_W_COLOR, colour)
+    return tcBorders
+
+
+# Built once at import; callers append deepcopy() clones instead of rebuilding
+_NIL_TBL_BORDERS_EL = parse_xml(_NIL_TBL_BORDERS_XML)
+# Cell with a bottom border only (underlined input area, blank lines)
+_UNDERLINED_TC_BORDERS_EL = _tc_borders_element(bottom=(4, '000000'))
+# Cell with a left border only (quote box, 2pt grey)
+_QUOTE_TC_BORDERS_EL = _tc_borders_element(left=(16, '808080'))
+_NIL_PBDR_EL = parse_xml(_NIL_PBDR_XML)
+_HEADER_RUN_RPR_EL = parse_xml(_HEADER_RUN_RPR_XML)
+_HEADER_PARAGRAPH_EL = parse_xml(_HEADER_PARAGRAPH_XML)
+_DEFAULT_HEADER_PARAGRAPH_EL = parse_xml(_DEFAULT_HEADER_PARAGRAPH_XML)
+_FOOTER_PARAGRAPH_EL = parse_xml(_FOOTER_PARAGRAPH_XML)
+
+# Stand-in header text in the cached header/footer templates, replaced by
+# setup_document_with_header()
+_HEADER_TEXT_PLACEHOLDER = '{header_text}'
 
 
 # =============================================================================
 # COLOUR SCHEMES - Selectable palettes for document styling
 # =============================================================================
 
+@dataclass(frozen=True, slots=True)
+class ColourScheme:
+    """A named colour palette. Built once at import; shared by all documents."""
+    heading: RGBColor
+    body: RGBColor
+    header_footer: RGBColor
+    table_header_bg: RGBColor
+    quote_bg: RGBColor
+    quote_border: RGBColor
+    instruction_bg: RGBColor
+    instruction_border: RGBColor
+    highlight_evidence: RGBColor
+    highlight_terms: RGBColor
+    table_border: RGBColor
+
+
 COLOUR_SCHEMES = {
-    'professional_minimal': {
-        'heading': RGBColor(0, 0, 0),           # Black
-        'body': RGBColor(0, 0, 0),              # Black
-        'header_footer': RGBColor(64, 64, 64),  # Dark Grey
-        'table_header_bg': RGBColor(242, 242, 242),  # Light Grey
-        'quote_bg': RGBColor(255, 250, 240),    # Cream
-        'quote_border': RGBColor(64, 64, 64),   # Dark Grey
-        'instruction_bg': RGBColor(242, 242, 242),   # Light Grey
-        'instruction_border': RGBColor(0, 0, 0),    # Black
-        'highlight_evidence': RGBColor(255, 255, 0),    # Yellow
-        'highlight_terms': RGBColor(242, 242, 242),     # Light Grey
-        'table_border': RGBColor(0, 0, 0),     # Black
-    },
-    'academic_blue': {
-        'heading': RGBColor(25, 55, 109),       # Deep Blue
-        'body': RGBColor(40, 40, 40),           # Charcoal
-        'header_footer': RGBColor(31, 78, 121),  # Navy Blue
-        'table_header_bg': RGBColor(217, 225, 242),   # Light Blue
-        'quote_bg': RGBColor(239, 243, 249),    # Pale Blue
-        'quote_border': RGBColor(25, 55, 109),  # Deep Blue
-        'instruction_bg': RGBColor(217, 225, 242),   # Light Blue
-        'instruction_border': RGBColor(25, 55, 109),  # Deep Blue
-        'highlight_evidence': RGBColor(255, 192, 0),   # Amber Yellow
-        'highlight_terms': RGBColor(217, 225, 242),    # Light Blue
-        'table_border': RGBColor(31, 78, 121),   # Navy Blue
-    },
-    'nature_green': {
-        'heading': RGBColor(34, 94, 56),        # Forest Green
-        'body': RGBColor(40, 40, 40),           # Charcoal
-        'header_footer': RGBColor(114, 145, 110),  # Sage Green
-        'table_header_bg': RGBColor(220, 237, 220),   # Mint Green
-        'quote_bg': RGBColor(242, 250, 242),    # Pale Mint
-        'quote_border': RGBColor(34, 94, 56),   # Forest Green
-        'instruction_bg': RGBColor(220, 237, 220),   # Mint Green
-        'instruction_border': RGBColor(34, 94, 56),  # Forest Green
-        'highlight_evidence': RGBColor(218, 165, 32),   # Warm Gold
-        'highlight_terms': RGBColor(220, 237, 220),     # Mint Green
-        'table_border': RGBColor(114, 145, 110),   # Sage Green
-    },
-    'creative_vibrant': {
-        'heading': RGBColor(75, 0, 130),        # Deep Purple
-        'body': RGBColor(40, 40, 40),           # Charcoal
-        'header_footer': RGBColor(147, 51, 234),  # Medium Purple
-        'table_header_bg': RGBColor(230, 220, 245),   # Light Lavender
-        'quote_bg': RGBColor(245, 240, 250),    # Pale Lavender
-        'quote_border': RGBColor(75, 0, 130),   # Deep Purple
-        'instruction_bg': RGBColor(230, 220, 245),   # Light Lavender
-        'instruction_border': RGBColor(75, 0, 130),  # Deep Purple
-        'highlight_evidence': RGBColor(255, 140, 0),   # Vibrant Orange
-        'highlight_terms': RGBColor(230, 220, 245),    # Light Lavender
-        'table_border': RGBColor(147, 51, 234),   # Medium Purple
-    },
-    'warm_humanities': {
-        'heading': RGBColor(154, 48, 19),       # Rust Red
-        'body': RGBColor(40, 40, 40),           # Charcoal
-        'header_footer': RGBColor(191, 87, 0),   # Burnt Sienna
-        'table_header_bg': RGBColor(242, 220, 200),   # Pale Terracotta
-        'quote_bg': RGBColor(255, 250, 240),    # Cream
-        'quote_border': RGBColor(154, 48, 19),  # Rust Red
-        'instruction_bg': RGBColor(242, 220, 200),   # Pale Terracotta
-        'instruction_border': RGBColor(154, 48, 19),  # Rust Red
-        'highlight_evidence': RGBColor(184, 134, 11),   # Deep Gold
-        'highlight_terms': RGBColor(242, 220, 200),    # Pale Terracotta
-        'table_border': RGBColor(191, 87, 0),    # Burnt Sienna
-    },
+    'professional_minimal': ColourScheme(
+        heading=_rgb(0, 0, 0),           # Black
+        body=_rgb(0, 0, 0),              # Black
+        header_footer=_rgb(64, 64, 64),  # Dark Grey
+        table_header_bg=_rgb(242, 242, 242),  # Light Grey
+        quote_bg=_rgb(255, 250, 240),    # Cream
+        quote_border=_rgb(64, 64, 64),   # Dark Grey
+        instruction_bg=_rgb(242, 242, 242),   # Light Grey
+        instruction_border=_rgb(0, 0, 0),    # Black
+        highlight_evidence=_rgb(255, 255, 0),    # Yellow
+        highlight_terms=_rgb(242, 242, 242),     # Light Grey
+        table_border=_rgb(0, 0, 0),     # Black
+    ),
+    'academic_blue': ColourScheme(
+        heading=_rgb(25, 55, 109),       # Deep Blue
+        body=_rgb(40, 40, 40),           # Charcoal
+        header_footer=_rgb(31, 78, 121),  # Navy Blue
+        table_header_bg=_rgb(217, 225, 242),   # Light Blue
+        quote_bg=_rgb(239, 243, 249),    # Pale Blue
+        quote_border=_rgb(25, 55, 109),  # Deep Blue
+        instruction_bg=_rgb(217, 225, 242),   # Light Blue
+        instruction_border=_rgb(25, 55, 109),  # Deep Blue
+        highlight_evidence=_rgb(255, 192, 0),   # Amber Yellow
+        highlight_terms=_rgb(217, 225, 242),    # Light Blue
+        table_border=_rgb(31, 78, 121),   # Navy Blue
+    ),
+    'nature_green': ColourScheme(
+        heading=_rgb(34, 94, 56),        # Forest Green
+        body=_rgb(40, 40, 40),           # Charcoal
+        header_footer=_rgb(114, 145, 110),  # Sage Green
+        table_header_bg=_rgb(220, 237, 220),   # Mint Green
+        quote_bg=_rgb(242, 250, 242),    # Pale Mint
+        quote_border=_rgb(34, 94, 56),   # Forest Green
+        instruction_bg=_rgb(220, 237, 220),   # Mint Green
+        instruction_border=_rgb(34, 94, 56),  # Forest Green
+        highlight_evidence=_rgb(218, 165, 32),   # Warm Gold
+        highlight_terms=_rgb(220, 237, 220),     # Mint Green
+        table_border=_rgb(114, 145, 110),   # Sage Green
+    ),
+    'creative_vibrant': ColourScheme(
+        heading=_rgb(75, 0, 130),        # Deep Purple
+        body=_rgb(40, 40, 40),           # Charcoal
+        header_footer=_rgb(147, 51, 234),  # Medium Purple
+        table_header_bg=_rgb(230, 220, 245),   # Light Lavender
+        quote_bg=_rgb(245, 240, 250),    # Pale Lavender
+        quote_border=_rgb(75, 0, 130),   # Deep Purple
+        instruction_bg=_rgb(230, 220, 245),   # Light Lavender
+        instruction_border=_rgb(75, 0, 130),  # Deep Purple
+        highlight_evidence=_rgb(255, 140, 0),   # Vibrant Orange
+        highlight_terms=_rgb(230, 220, 245),    # Light Lavender
+        table_border=_rgb(147, 51, 234),   # Medium Purple
+    ),
+    'warm_humanities': ColourScheme(
+        heading=_rgb(154, 48, 19),       # Rust Red
+        body=_rgb(40, 40, 40),           # Charcoal
+        header_footer=_rgb(191, 87, 0),   # Burnt Sienna
+        table_header_bg=_rgb(242, 220, 200),   # Pale Terracotta
+        quote_bg=_rgb(255, 250, 240),    # Cream
+        quote_border=_rgb(154, 48, 19),  # Rust Red
+        instruction_bg=_rgb(242, 220, 200),   # Pale Terracotta
+        instruction_border=_rgb(154, 48, 19),  # Rust Red
+        highlight_evidence=_rgb(184, 134, 11),   # Deep Gold
+        highlight_terms=_rgb(242, 220, 200),    # Pale Terracotta
+        table_border=_rgb(191, 87, 0),    # Burnt Sienna
+    ),
 }
 
 # Default colour scheme
@@ -171,6 +394,18 @@ STYLE_QUESTION = 'Normal'             # Questions use Normal (styled inline)
 STYLE_INSTRUCTION = 'Normal'          # Instructions use Normal (styled inline)
 STYLE_QUOTE = 'Quote'                 # Quote/extract (12pt, italic)
 STYLE_CAPTION = 'Caption'             # Image caption (10pt, italic, grey)
+STYLE_OPTION = 'List Paragraph'       # Multiple-choice options (11pt, indented)
+
+
+# XML-level style fixes applied by _patch_style_xml(), keyed by styleId:
+# (font set on all four rFonts slots, whether to remove paragraph borders)
+_STYLE_XML_PATCHES = {
+    'Title': (FONT_DISPLAY, True),
+    'Subtitle': (FONT_PRIMARY, True),
+    'Heading1': (FONT_DISPLAY, False),
+    'Heading2': (FONT_DISPLAY, False),
+    'Heading3': (FONT_PRIMARY, False),
+}
 
 
 # =============================================================================
@@ -190,6 +425,7 @@ def setup_document(colour_scheme='professional_minimal'):
     - Normal: Body text (12pt Aptos)
     - Quote: Quote text (12pt Aptos, Italic)
     - Caption: Image caption (10pt Aptos, Italic, Grey)
+    - List Paragraph: Multiple-choice option (11pt Aptos, indented)
 
     Args:
         colour_scheme: Colour palette to use. Options:
@@ -203,19 +439,101 @@ def setup_document(colour_scheme='professional_minimal'):
         Document: Configured document with A4 page size, custom margins
                   (Top: 1cm, Bottom/Left/Right: 2cm) and selected colour scheme
     """
-    doc = Document()
-
-    # Validate colour scheme
+    # Validate colour scheme before touching the template cache
     if colour_scheme not in COLOUR_SCHEMES:
         raise ValueError(
             f"Unknown colour scheme: {colour_scheme}. "
             f"Available schemes: {', '.join(COLOUR_SCHEMES.keys())}"
         )
 
+    # Clone the pre-styled template for this scheme (styles and page layout
+    # are already applied, so only the Python-side attributes need setting)
+    doc = Document(BytesIO(_get_style_template(colour_scheme)))
+
     # Store colour scheme in document object for use by other functions
     doc.colour_scheme = colour_scheme
     doc.colours = COLOUR_SCHEMES[colour_scheme]
 
+    return doc
+
+
+def setup_document_with_header(colour_scheme='professional_minimal', year_level='',
+                               unit_name='', doc_type=None, include_name=True):
+    """
+    Equivalent of setup_document() followed by add_header_footer().
+
+    The headers and footer are identical for every document apart from the
+    header text, so each (colour scheme, include_name) combination is built
+    once with a placeholder and cached as a serialised package. Each call
+    loads that package and writes the real header text into it.
+
+    Args:
+        colour_scheme: Colour palette to use (see setup_document())
+        year_level, unit_name, doc_type, include_name: As for add_header_footer()
+
+    Returns:
+        Document: Configured document with header and footer in place
+    """
+    if colour_scheme not in COLOUR_SCHEMES:
+        raise ValueError(
+            f"Unknown colour scheme: {colour_scheme}. "
+            f"Available schemes: {', '.join(COLOUR_SCHEMES.keys())}"
+        )
+
+    doc = Document(BytesIO(_header_footer_template(colour_scheme, include_name)))
+    doc.colour_scheme = colour_scheme
+    doc.colours = COLOUR_SCHEMES[colour_scheme]
+
+    header_text = _header_text(year_level, unit_name, doc_type)
+    section = doc.sections[0]
+    for header in (section.first_page_header, section.header):
+        for t in header._element.iter(_W_T):
+            if t.text == _HEADER_TEXT_PLACEHOLDER:
+                t.text = header_text
+
+    return doc
+
+
+@functools.lru_cache(maxsize=2 * len(COLOUR_SCHEMES))
+def _header_footer_template(colour_scheme, include_name):
+    """Serialised blank document with placeholder headers and page-number footer."""
+    doc = setup_document(colour_scheme)
+    _build_header_footer(doc, _HEADER_TEXT_PLACEHOLDER, include_name)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _get_style_template(colour_scheme):
+    """
+    Return the serialised blank document for a colour scheme.
+
+    Style setup is identical for every document using the same scheme, so
+    the blanks are normally prebuilt at import (see _BLANKS at the end of this
+    module) and shared between sessions. With DOCX_STYLES_NO_PREBUILD set,
+    each scheme is built on first use instead.
+    setup_document() loads a fresh Document from these bytes on every call.
+
+    Returns:
+        bytes: The blank DOCX package
+    """
+    blank = _BLANKS.get(colour_scheme)
+    if blank is None:
+        blank = _BLANKS[colour_scheme] = _build_blank(colour_scheme)
+    return blank
+
+
+def _build_blank(colour_scheme):
+    """
+    Build the styled, page-configured blank document for a colour scheme.
+
+    Returns:
+        bytes: The blank DOCX package
+    """
+    doc = Document()
+    doc.colour_scheme = colour_scheme
+    doc.colours = COLOUR_SCHEMES[colour_scheme]
+
     # Configure page layout (first section)
     section = doc.sections[0]
     section.page_width = PAGE_WIDTH_A4
@@ -230,7 +548,9 @@ def setup_document(colour_scheme='professional_minimal'):
     # Modify built-in styles for this document
     _create_styles(doc)
 
-    return doc
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
 
 
 def _create_styles(doc):
@@ -249,79 +569,78 @@ def _create_styles(doc):
     # Get colours from the document's selected scheme
     colours = doc.colours
 
+    # --- Document Defaults (Body Text) ---
+    # Font, size and body colour go on w:docDefaults in one XML patch, so
+    # Normal and every style based on it inherit them without overrides.
+    # Explicit fonts also replace the template's theme fonts, which Word
+    # would otherwise prefer over a style-level font name.
+    rPrDefault = styles.element.find(_W_DOC_DEFAULTS).find(_W_RPR_DEFAULT)
+    rPrDefault.replace(
+        rPrDefault.find(_W_RPR),
+        parse_xml(_rpr_default_xml(doc.colour_scheme))
+    )
+
     # --- Normal Style (Body Text) ---
     # This is the base style - must be configured first
     normal_style = styles['Normal']
-    normal_style.font.name = FONT_PRIMARY
-    normal_style.font.size = SIZE_BODY
-    normal_style.font.color.rgb = colours['body']
     normal_style.paragraph_format.space_after = SPACING_AFTER_PARA
     normal_style.paragraph_format.line_spacing = LINE_SPACING
 
+    # Title, Subtitle and Heading 1-3 fonts are set only by _patch_style_xml()
+    # below. The template gives these styles theme fonts, which Word prefers
+    # over w:ascii, so style.font.name alone does not take effect and setting
+    # it first would just be overwritten by the patch.
+
     # --- Title Style ---
     title_style = styles['Title']
-    title_style.font.name = FONT_DISPLAY
     title_style.font.size = SIZE_TITLE  # 20pt
     title_style.font.bold = True
-    title_style.font.color.rgb = colours['heading']
+    title_style.font.color.rgb = colours.heading
     title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
     title_style.paragraph_format.space_before = Pt(12)  # Space from header
     title_style.paragraph_format.space_after = Pt(8)  # Space before next element
-    _remove_style_borders(title_style)
-    _set_style_font_xml(title_style, FONT_DISPLAY)  # Ensure font at XML level
 
     # --- Subtitle Style ---
     subtitle_style = styles['Subtitle']
-    subtitle_style.font.name = FONT_PRIMARY
     subtitle_style.font.size = SIZE_SUBTITLE
     subtitle_style.font.bold = True
-    subtitle_style.font.color.rgb = colours['heading']
+    subtitle_style.font.color.rgb = colours.heading
     subtitle_style.font.italic = False  # Override default italic
     subtitle_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
     subtitle_style.paragraph_format.space_before = Pt(0)
     subtitle_style.paragraph_format.space_after = Pt(12)
-    _remove_style_borders(subtitle_style)
-    _set_style_font_xml(subtitle_style, FONT_PRIMARY)  # Ensure font at XML level
 
     # --- Heading 1 Style ---
     h1_style = styles['Heading 1']
-    h1_style.font.name = FONT_DISPLAY
     h1_style.font.size = Pt(18)  # Main section headings
     h1_style.font.bold = True
-    h1_style.font.color.rgb = colours['heading']
+    h1_style.font.color.rgb = colours.heading
     h1_style.font.underline = False  # Remove default underline
     h1_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
     h1_style.paragraph_format.space_before = SPACING_BEFORE_HEADING
     h1_style.paragraph_format.space_after = SPACING_AFTER_HEADING
-    _set_style_font_xml(h1_style, FONT_DISPLAY)  # Ensure font at XML level
 
     # --- Heading 2 Style ---
     h2_style = styles['Heading 2']
-    h2_style.font.name = FONT_DISPLAY
     h2_style.font.size = Pt(16)  # Subsection headings
     h2_style.font.bold = True
-    h2_style.font.color.rgb = colours['heading']
+    h2_style.font.color.rgb = colours.heading
     h2_style.font.underline = False  # Remove default underline
     h2_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
     h2_style.paragraph_format.space_before = SPACING_BEFORE_HEADING
     h2_style.paragraph_format.space_after = SPACING_AFTER_HEADING
-    _set_style_font_xml(h2_style, FONT_DISPLAY)  # Ensure font at XML level
 
     # --- Heading 3 Style ---
     h3_style = styles['Heading 3']
-    h3_style.font.name = FONT_PRIMARY
     h3_style.font.size = SIZE_HEADING3
     h3_style.font.bold = True
-    h3_style.font.color.rgb = colours['heading']
+    h3_style.font.color.rgb = colours.heading
     h3_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
     h3_style.paragraph_format.space_before = Pt(10)
     h3_style.paragraph_format.space_after = Pt(4)
-    _set_style_font_xml(h3_style, FONT_PRIMARY)  # Ensure font at XML level
 
     # --- Quote Style ---
     quote_style = styles['Quote']
-    quote_style.font.name = FONT_PRIMARY
-    quote_style.font.size = SIZE_BODY
     quote_style.font.italic = True
     quote_style.font.color.rgb = COLOUR_BLACK
     quote_style.paragraph_format.line_spacing = 1.5
@@ -329,13 +648,44 @@ def _create_styles(doc):
 
     # --- Caption Style ---
     caption_style = styles['Caption']
-    caption_style.font.name = FONT_PRIMARY
     caption_style.font.size = SIZE_CAPTION
     caption_style.font.italic = True
     caption_style.font.color.rgb = COLOUR_GREY
     caption_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
     caption_style.paragraph_format.space_after = Pt(12)
 
+    # --- List Paragraph Style (multiple-choice options) ---
+    # Options keep body-text spacing (6pt after each). The template's
+    # contextual spacing would drop that space between consecutive options,
+    # so it is removed.
+    option_style = styles[STYLE_OPTION]
+    option_style.font.size = SIZE_QUESTION
+    option_style.paragraph_format.left_indent = Cm(1.27)
+    option_style.paragraph_format.space_before = SPACING_NONE
+    option_style.paragraph_format.space_after = SPACING_AFTER_PARA
+    option_pPr = option_style.element.get_or_add_pPr()
+    for contextual in option_pPr.findall(_W_CONTEXTUAL_SPACING):
+        option_pPr.remove(contextual)
+
+    # XML-level fixes (explicit fonts, no borders) in one pass over the styles part
+    _patch_style_xml(styles.element)
+
+
+@functools.lru_cache(maxsize=len(COLOUR_SCHEMES))
+def _rpr_default_xml(colour_scheme):
+    """Document-wide default run properties (font, size, body colour) for a scheme."""
+    font = FONT_PRIMARY
+    half_points = int(SIZE_BODY.pt * 2)
+    return (
+        f'<w:rPr {_W_NSDECL}>'
+        f'<w:rFonts w:ascii="{font}" w:hAnsi="{font}" w:eastAsia="{font}" w:cs="{font}"/>'
+        f'<w:color w:val="{COLOUR_SCHEMES[colour_scheme].body}"/>'
+        f'<w:sz w:val="{half_points}"/>'
+        f'<w:szCs w:val="{half_points}"/>'
+        '<w:lang w:val="en-US" w:eastAsia="en-US" w:bidi="ar-SA"/>'
+        '</w:rPr>'
+    )
+
 
 def add_header_footer(doc, year_level, unit_name, doc_type=None, include_name=True):
     """
@@ -353,19 +703,27 @@ def add_header_footer(doc, year_level, unit_name, doc_type=None, include_name=Tr
                   If None, omitted from header
         include_name: Whether to include Name field in first-page header (default True)
     """
-    section = doc.sections[0]
+    _build_header_footer(doc, _header_text(year_level, unit_name, doc_type), include_name)
 
-    # Enable different first page header/footer
-    section.different_first_page_header_footer = True
 
+def _header_text(year_level, unit_name, doc_type):
+    """Header line: "Year X English - Unit Name - Doc Type", skipping empty parts."""
     # Ensure year_level is formatted correctly
-    if not str(year_level).lower().startswith('year'):
+    year_level = str(year_level)
+    if year_level[:4].lower() != 'year':
         year_level = f"Year {year_level}"
 
-    # Build header text
-    header_text = f"{year_level} English - {unit_name}"
-    if doc_type:
-        header_text += f" - {doc_type}"
+    return " - ".join(
+        part for part in (f"{year_level} English", f"{unit_name}", doc_type) if part
+    )
+
+
+def _build_header_footer(doc, header_text, include_name):
+    """Build the headers and footer for add_header_footer() from finished header text."""
+    section = doc.sections[0]
+
+    # Enable different first page header/footer
+    section.different_first_page_header_footer = True
 
     # Header with table layout for left/right alignment (first page)
     header = section.first_page_header
@@ -384,96 +742,93 @@ def add_header_footer(doc, year_level, unit_name, doc_type=None, include_name=Tr
         tbl = header_table._tbl
         tblPr = tbl.tblPr if tbl.tblPr is not None else OxmlElement('w:tblPr')
         tblW = OxmlElement('w:tblW')
-        tblW.set(qn('w:w'), str(int(CONTENT_WIDTH.twips)))
-        tblW.set(qn('w:type'), 'dxa')
+        tblW.set(_W_W, str(int(CONTENT_WIDTH.twips)))
+        tblW.set(_W_TYPE, 'dxa')
         tblPr.append(tblW)
 
         # Remove table borders
-        tblBorders = OxmlElement('w:tblBorders')
-        for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
-            border = OxmlElement(f'w:{border_name}')
-            border.set(qn('w:val'), 'nil')
-            tblBorders.append(border)
-        tblPr.append(tblBorders)
+        tblPr.append(deepcopy(_NIL_TBL_BORDERS_EL))
 
-        row = header_table.rows[0]
-        left_cell = row.cells[0]
-        right_cell = row.cells[1]
+        left_cell, right_cell = _row_cells(header_table)
 
         # Set column widths (left: ~60%, right: ~40% for extended name line)
         left_cell.width = Cm(10)
         right_cell.width = Cm(6)
 
         # Left cell: document info
-        left_para = left_cell.paragraphs[0]
-        left_run = left_para.add_run(header_text)
-        left_run.font.name = FONT_PRIMARY
-        left_run.font.size = SIZE_HEADER_FOOTER
-        left_run.font.color.rgb = COLOUR_DARK_GREY  # Darker grey for better readability
+        left_para = _cell_paragraph(left_cell)
+        _add_header_run(left_para, header_text)
         left_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
-        # Right cell: Name field with underscores
-        right_para = right_cell.paragraphs[0]
-        name_run = right_para.add_run("Name: ")
-        name_run.font.name = FONT_PRIMARY
-        name_run.font.size = SIZE_HEADER_FOOTER
-        name_run.font.color.rgb = COLOUR_DARK_GREY  # Darker grey for better readability
-
-        # Add underscores for the line (26 chars = 30% longer for extended name space)
-        line_run = right_para.add_run("_" * 26)
-        line_run.font.name = FONT_PRIMARY
-        line_run.font.size = SIZE_HEADER_FOOTER
-        line_run.font.color.rgb = COLOUR_DARK_GREY  # Darker grey for better readability
-        right_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+        # Right cell: Name field. The writing line is a right tab stop with an
+        # underscore leader at the cell's text edge (width minus 0.19cm padding
+        # each side), so it fills the cell at any width.
+        right_para = _cell_paragraph(right_cell)
+        right_para.paragraph_format.tab_stops.add_tab_stop(
+            Twips(right_cell.width.twips - 2 * CELL_PADDING.twips),
+            WD_TAB_ALIGNMENT.RIGHT,
+            WD_TAB_LEADER.LINES
+        )
+        _add_header_run(right_para, "Name: ").add_tab()
+        right_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     else:
         # Simple header without name field (original behaviour)
         header_para = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
-        header_para.clear()
-        header_run = header_para.add_run(header_text)
-        header_run.font.name = FONT_PRIMARY
-        header_run.font.size = SIZE_HEADER_FOOTER
-        header_run.font.color.rgb = COLOUR_DARK_GREY  # Darker grey for better readability
-        header_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        new_p = deepcopy(_HEADER_PARAGRAPH_EL)
+        new_p.append(_header_run_element(header_text))
+        _replace_paragraph(header_para, new_p)
 
     # Set up default header for subsequent pages (without name field)
     default_header = section.header
-    for para in default_header.paragraphs:
+    for para in default_header.paragraphs[1:]:
         para.clear()
 
     default_header_para = default_header.paragraphs[0] if default_header.paragraphs else default_header.add_paragraph()
-    default_header_para.clear()
-    default_header_run = default_header_para.add_run(header_text)
-    default_header_run.font.name = FONT_PRIMARY
-    default_header_run.font.size = SIZE_HEADER_FOOTER
-    default_header_run.font.color.rgb = COLOUR_DARK_GREY
-    default_header_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    default_header_para.paragraph_format.space_after = Pt(6)  # Add spacing to match table-based header
+    new_p = deepcopy(_DEFAULT_HEADER_PARAGRAPH_EL)
+    new_p.append(_header_run_element(header_text))
+    _replace_paragraph(default_header_para, new_p)
 
     # Footer with page number
     footer = section.footer
     footer_para = footer.paragraphs[0] if footer.paragraphs else footer.add_paragraph()
-    footer_para.clear()
-    footer_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-
-    # Add page number field (must be wrapped in runs for valid OOXML)
-    run1 = OxmlElement('w:r')
-    fldChar1 = OxmlElement('w:fldChar')
-    fldChar1.set(qn('w:fldCharType'), 'begin')
-    run1.append(fldChar1)
-    footer_para._p.append(run1)
-
-    run2 = OxmlElement('w:r')
-    instrText = OxmlElement('w:instrText')
-    instrText.set(qn('xml:space'), 'preserve')
-    instrText.text = " PAGE "
-    run2.append(instrText)
-    footer_para._p.append(run2)
-
-    run3 = OxmlElement('w:r')
-    fldChar2 = OxmlElement('w:fldChar')
-    fldChar2.set(qn('w:fldCharType'), 'end')
-    run3.append(fldChar2)
-    footer_para._p.append(run3)
+    _replace_paragraph(footer_para, deepcopy(_FOOTER_PARAGRAPH_EL))
+
+
+def _header_run_element(text):
+    """
+    Build a ``w:r`` for header/footer text (Aptos 10pt, dark grey).
+
+    The run properties are a clone of a prebuilt fragment and the text is
+    set on a SubElement, so no XML is formatted or parsed per run.
+    """
+    r = OxmlElement('w:r')
+    r.append(deepcopy(_HEADER_RUN_RPR_EL))
+    t = etree.SubElement(r, _W_T)
+    t.set(_XML_SPACE, 'preserve')
+    t.text = text
+    return r
+
+
+def _add_header_run(para, text):
+    """Append a run with header/footer formatting (Aptos 10pt, dark grey)."""
+    r = _header_run_element(text)
+    para._p.append(r)
+    return Run(r, para)
+
+
+def _replace_paragraph(para, new_p):
+    """
+    Swap a paragraph's ``w:p`` element for new_p in place.
+
+    Replacing header/footer contents wholesale is one lxml replace, rather
+    than clearing the old runs one by one and re-adding formatted content.
+
+    Returns:
+        Paragraph object wrapping new_p
+    """
+    old_p = para._p
+    old_p.getparent().replace(old_p, new_p)
+    return Paragraph(new_p, para._parent)
 
 
 # =============================================================================
@@ -492,7 +847,7 @@ def add_title(doc, text, centre=True):
     Returns:
         Paragraph object
     """
-    para = doc.add_paragraph(text, style=STYLE_TITLE)
+    para = _add_paragraph(doc, text, style=STYLE_TITLE)
     if not centre:
         para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     return para
@@ -510,7 +865,7 @@ def add_subtitle(doc, text, centre=True):
     Returns:
         Paragraph object
     """
-    para = doc.add_paragraph(text, style=STYLE_SUBTITLE)
+    para = _add_paragraph(doc, text, style=STYLE_SUBTITLE)
     if not centre:
         para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     return para
@@ -527,7 +882,7 @@ def add_section_heading(doc, text):
     Returns:
         Paragraph object
     """
-    return doc.add_paragraph(text, style=STYLE_HEADING1)
+    return _add_paragraph(doc, text, style=STYLE_HEADING1)
 
 
 def add_subsection_heading(doc, text):
@@ -541,13 +896,18 @@ def add_subsection_heading(doc, text):
     Returns:
         Paragraph object
     """
-    return doc.add_paragraph(text, style=STYLE_HEADING2)
+    return _add_paragraph(doc, text, style=STYLE_HEADING2)
 
 
 # =============================================================================
 # STUDENT INFORMATION
 # =============================================================================
 
+# Name/date block layouts: (label, label width, input width) per field
+_COLS_WITH_DATE = (("Name:", Cm(1.5), Cm(8)), ("Date:", Cm(1.5), Cm(4)))
+_COLS_NAME_ONLY = (("Name:", Cm(1.5), Cm(5)),)
+
+
 def add_name_date_block(doc, include_date=False):
     """
     Add Name block for student worksheets.
@@ -560,64 +920,29 @@ def add_name_date_block(doc, include_date=False):
     Returns:
         Table object
     """
-    if include_date:
-        # Legacy 4-column layout with date
-        table = doc.add_table(rows=1, cols=4)
-        table.autofit = False
-        table.alignment = WD_TABLE_ALIGNMENT.LEFT
-
-        row = table.rows[0]
-        cells = row.cells
-
-        # Name label
-        name_label = cells[0].paragraphs[0]
-        name_run = name_label.add_run("Name:")
-        name_run.bold = True
-        name_run.font.name = FONT_PRIMARY
-        name_run.font.size = SIZE_BODY
-        cells[0].width = Cm(1.5)
-
-        # Name input (underlined space)
-        cells[1].width = Cm(8)
-        _add_underlined_cell(cells[1])
-
-        # Date label
-        date_label = cells[2].paragraphs[0]
-        date_run = date_label.add_run("Date:")
-        date_run.bold = True
-        date_run.font.name = FONT_PRIMARY
-        date_run.font.size = SIZE_BODY
-        cells[2].width = Cm(1.5)
-
-        # Date input (underlined space)
-        cells[3].width = Cm(4)
-        _add_underlined_cell(cells[3])
-    else:
-        # New simplified 2-column layout (name only, 60% width)
-        table = doc.add_table(rows=1, cols=2)
-        table.autofit = False
-        table.alignment = WD_TABLE_ALIGNMENT.LEFT
-
-        row = table.rows[0]
-        cells = row.cells
-
-        # Name label
-        name_label = cells[0].paragraphs[0]
-        name_run = name_label.add_run("Name:")
-        name_run.bold = True
-        name_run.font.name = FONT_PRIMARY
-        name_run.font.size = SIZE_BODY
-        cells[0].width = Cm(1.5)
-
-        # Name input (underlined space - ~60% of previous 8cm = ~5cm)
-        cells[1].width = Cm(5)
-        _add_underlined_cell(cells[1])
+    # Legacy 4-column layout with date, or simplified name-only layout
+    columns = _COLS_WITH_DATE if include_date else _COLS_NAME_ONLY
+
+    table = _add_table(doc, 1, 2 * len(columns))
+    table.autofit = False
+    table.alignment = WD_TABLE_ALIGNMENT.LEFT
+
+    cells = _row_cells(table)
+    for i, (label, label_width, input_width) in enumerate(columns):
+        label_cell = cells[2 * i]
+        _add_styled_run(_cell_paragraph(label_cell), label, bold=True)
+        label_cell.width = label_width
+
+        # Input (underlined space)
+        input_cell = cells[2 * i + 1]
+        input_cell.width = input_width
+        _add_underlined_cell(input_cell)
 
     # Remove all borders from table
     _remove_table_borders(table)
 
     # Add spacing after
-    doc.add_paragraph()
+    _add_paragraph(doc)
 
     return table
 
@@ -639,27 +964,35 @@ def add_name_block(doc):
 def _add_underlined_cell(cell):
     """Add bottom border only to a cell to create underlined input area."""
     tcPr = cell._tc.get_or_add_tcPr()
-    tcBorders = parse_xml(
-        r'<w:tcBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-        r'<w:top w:val="nil"/>'
-        r'<w:left w:val="nil"/>'
-        r'<w:right w:val="nil"/>'
-        r'<w:bottom w:val="single" w:sz="4" w:color="000000"/>'
-        r'</w:tcBorders>'
-    )
-    tcPr.append(tcBorders)
+    tcPr.append(deepcopy(_UNDERLINED_TC_BORDERS_EL))
+
+
+def _row_cells(table, row_idx=0):
+    """
+    Return the cells of one table row, wrapping its ``w:tc`` elements directly.
+
+    Unlike ``table.rows[i].cells``, this does not rebuild the whole table's
+    cell grid (which python-docx does on every access), so it stays cheap no
+    matter how large the table is. Merged cells are not resolved.
+    """
+    return [_Cell(tc, table) for tc in table._tbl.tr_lst[row_idx].tc_lst]
+
+
+def _cell_paragraph(cell):
+    """
+    Return the first paragraph of a cell without building ``cell.paragraphs``.
+
+    A new cell holds exactly one ``w:p``; wrapping it directly avoids walking
+    the cell's children and constructing a Paragraph for each one.
+    """
+    return Paragraph(cell._tc.find(_W_P), cell)
 
 
 def _remove_table_borders(table):
     """Remove all borders from a table."""
     tbl = table._tbl
     tblPr = tbl.tblPr if tbl.tblPr is not None else OxmlElement('w:tblPr')
-    tblBorders = OxmlElement('w:tblBorders')
-    for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
-        border = OxmlElement(f'w:{border_name}')
-        border.set(qn('w:val'), 'nil')
-        tblBorders.append(border)
-    tblPr.append(tblBorders)
+    tblPr.append(deepcopy(_NIL_TBL_BORDERS_EL))
     if tbl.tblPr is None:
         tbl.insert(0, tblPr)
 
@@ -684,50 +1017,48 @@ def add_blank_lines(doc, num_lines=2, add_spacing=True):
     Returns:
         Table object
     """
-    table = doc.add_table(rows=num_lines, cols=1)
+    tbl = _append_block(doc, deepcopy(_blank_lines_template(num_lines)))
+
+    # Add spacing after blank lines table (unless it's a section-ending response)
+    if add_spacing:
+        _add_spacer_paragraph(doc, SPACING_AFTER_PARA)
+
+    return Table(tbl, doc._body)
+
+
+@functools.lru_cache(maxsize=16)
+def _blank_lines_template(num_lines):
+    """
+    Full ``w:tbl`` of underlined response lines; deepcopy() before use.
+
+    Callers use a handful of line counts (2, 4, 6, 18, 33), so each size is
+    built once and every later call is a single copy of the finished table.
+    """
+    table = Table(CT_Tbl.new_tbl(1, 1, CONTENT_WIDTH), None)
     table.autofit = False
     table.alignment = WD_TABLE_ALIGNMENT.LEFT
 
-    # Set table width to content width
-    table.columns[0].width = CONTENT_WIDTH
+    # Format a single full-height row, then clone it for the remaining lines
+    row = table.rows[0]
+    row.height = BLANK_LINE_HEIGHT
+    row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
 
-    for idx, row in enumerate(table.rows):
-        # First row is smaller to reduce space after question
-        if idx == 0:
-            row.height = Cm(0.35)  # Half height for first row
-        else:
-            row.height = BLANK_LINE_HEIGHT
-        row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-
-        cell = row.cells[0]
-        # Remove all borders except bottom
-        tcPr = cell._tc.get_or_add_tcPr()
-        tcBorders = parse_xml(
-            r'<w:tcBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-            r'<w:top w:val="nil"/>'
-            r'<w:left w:val="nil"/>'
-            r'<w:right w:val="nil"/>'
-            r'<w:bottom w:val="single" w:sz="4" w:color="000000"/>'
-            r'</w:tcBorders>'
-        )
-        tcPr.append(tcBorders)
+    # Remove all borders except bottom
+    tcPr = row._tr.tc_lst[0].get_or_add_tcPr()
+    tcPr.append(deepcopy(_UNDERLINED_TC_BORDERS_EL))
 
-        # Remove cell padding
-        tcMar = OxmlElement('w:tcMar')
-        for margin_name in ['top', 'left', 'bottom', 'right']:
-            margin = OxmlElement(f'w:{margin_name}')
-            margin.set(qn('w:w'), '0')
-            margin.set(qn('w:type'), 'dxa')
-            tcMar.append(margin)
-        tcPr.append(tcMar)
+    # Remove cell padding
+    tcPr.append(deepcopy(_tc_mar_template(0)))
 
-    # Add spacing after blank lines table (unless it's a section-ending response)
-    if add_spacing:
-        spacing_para = doc.add_paragraph()
-        spacing_para.paragraph_format.space_before = Pt(0)
-        spacing_para.paragraph_format.space_after = Pt(6)
+    tbl = table._tbl
+    proto_tr = row._tr
+    for _ in range(num_lines - 1):
+        tbl.append(deepcopy(proto_tr))
 
-    return table
+    # First row is smaller to reduce space after question
+    row.height = BLANK_LINE_FIRST_HEIGHT
+
+    return tbl
 
 
 def add_half_page_response(doc):
@@ -805,7 +1136,6 @@ def add_analysis_table(doc, data, has_header_bg=True, use_blue=False):
     if isinstance(data, dict):
         data = list(data.items())
 
-    table = doc.add_table(rows=len(data), cols=2)
     # Calculate optimal left column width based on longest label
     # Heuristic: 0.23 cm per character + 0.5 cm padding (V15)
     # V14 (2.06cm) was too narrow and wrapped. 12pt Bold needs more space.
@@ -820,60 +1150,44 @@ def add_analysis_table(doc, data, has_header_bg=True, use_blue=False):
     # Enforce a reasonable minimum (1.0 cm) and maximum (3.5 cm)
     optimal_width = max(1.0, min(optimal_width, 3.5))
 
-    table.style = 'Table Grid'
-    table.autofit = False  # Critical: Disable autofit to enforce our calculated width
-    table.allow_autofit = False
-
-    table.columns[0].width = Cm(optimal_width)
-    table.columns[1].width = Cm(17.0 - optimal_width)  # Remainder of 17cm page width
-
-    for i, (key, value) in enumerate(data):
-        row = table.rows[i]
-        row.height_rule = WD_ROW_HEIGHT_RULE.AUTO  # Let content determine height
-
-        # Set vertical alignment and padding for both cells in the row
-        for cell in row.cells:
-            _set_vertical_alignment(cell, 'center')
-            _set_cell_padding(cell, Cm(0.19))  # Consistent padding: 0.19cm
-
-            # Remove line/paragraph spacing inside table cells for perfect centering
-            for para in cell.paragraphs:
-                para.paragraph_format.space_before = Pt(0)
-                para.paragraph_format.space_after = Pt(0)
-                para.paragraph_format.line_spacing = 1.0  # Force single spacing
-
-        # First cell (key) - Labels are Bold and Left-Aligned
-        key_cell = row.cells[0]
-        key_para = key_cell.paragraphs[0]
-        key_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        key_run = key_para.add_run(str(key))
-        key_run.bold = True
-        key_run.font.name = FONT_PRIMARY
-        key_run.font.size = SIZE_BODY
-
-        # Apply background to header column if requested
-        if has_header_bg:
-            shading_elm = OxmlElement('w:shd')
-            if use_blue:
-                shading_elm.set(qn('w:fill'), '4472C4')  # Blue (legacy)
-                key_run.font.color.rgb = COLOUR_WHITE
-            else:
-                shading_elm.set(qn('w:fill'), 'F2F2F2')  # Light grey (spec)
-                key_run.font.color.rgb = COLOUR_BLACK
-            key_cell._element.get_or_add_tcPr().append(shading_elm)
-
-        # Second cell (value)
-        value_cell = row.cells[1]
-        value_para = value_cell.paragraphs[0]
-        value_run = value_para.add_run(str(value))
-        value_run.font.name = FONT_PRIMARY
-        value_run.font.size = SIZE_BODY
-
-        # Explicitly set cell widths to ensure Word respects them
-        row.cells[0].width = Cm(optimal_width)
-        row.cells[1].width = Cm(17.0 - optimal_width)
+    # Fixed layout (autofit off) so Word respects the calculated widths;
+    # the value column takes the remainder of the 17cm page width
+    key_width = Cm(optimal_width).twips
+    value_width = Cm(17.0 - optimal_width).twips
+
+    # Labels are bold and left-aligned, optionally on a coloured background
+    key_rpr = '<w:b/>'
+    key_shading = ''
+    if has_header_bg:
+        if use_blue:
+            key_shading = _SHADING_TEMPLATE.format(fill='4472C4')  # Blue (legacy)
+            key_rpr += f'<w:color w:val="{COLOUR_WHITE}"/>'
+        else:
+            key_shading = _SHADING_TEMPLATE.format(fill='F2F2F2')  # Light grey (spec)
+            key_rpr += f'<w:color w:val="{COLOUR_BLACK}"/>'
+    key_jc = _JC_TEMPLATE.format(align='left')
+
+    rows_xml = ''.join(
+        _ROW_TEMPLATE.format(cells=(
+            _CELL_TEMPLATE.format(
+                width=key_width, shading=key_shading, jc=key_jc,
+                run=_run_xml(str(key), key_rpr)
+            )
+            + _CELL_TEMPLATE.format(
+                width=value_width, shading='', jc='', run=_run_xml(str(value))
+            )
+        ))
+        for key, value in data
+    )
+    tbl = parse_xml(_TBL_TEMPLATE.format(
+        layout='<w:tblLayout w:type="fixed"/>',
+        grid=(_GRID_COL_TEMPLATE.format(width=key_width)
+              + _GRID_COL_TEMPLATE.format(width=value_width)),
+        rows=rows_xml
+    ))
+    _append_block(doc, tbl)
 
-    return table
+    return Table(tbl, doc._body)
 
 
 def add_content_table(doc, headers, rows, header_bg=True):
@@ -888,57 +1202,50 @@ def add_content_table(doc, headers, rows, header_bg=True):
 
     Returns:
         Table object
+
+    Raises:
+        ValueError: If a row has more cells than there are headers
     """
-    table = doc.add_table(rows=len(rows) + 1, cols=len(headers))
-    table.style = 'Table Grid'
-
-    # Header row
-    header_row = table.rows[0]
-    header_row.height_rule = WD_ROW_HEIGHT_RULE.AUTO  # Auto height for header
-    for i, header_text in enumerate(headers):
-        cell = header_row.cells[i]
-        para = cell.paragraphs[0]
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER  # Centre align header text
-        # Remove paragraph spacing for compact height
-        para.paragraph_format.space_before = Pt(0)
-        para.paragraph_format.space_after = Pt(0)
-        para.paragraph_format.line_spacing = 1.0
-
-        run = para.add_run(str(header_text))
-        run.bold = True
-        run.font.name = FONT_PRIMARY
-        run.font.size = SIZE_BODY
-
-        if header_bg:
-            shading_elm = OxmlElement('w:shd')
-            shading_elm.set(qn('w:fill'), 'F2F2F2')
-            cell._element.get_or_add_tcPr().append(shading_elm)
-
-        # Add consistent padding (0.19cm) and vertical centre alignment
-        _set_cell_padding(cell, Cm(0.19))
-        _set_vertical_alignment(cell, 'center')
-
-    # Data rows
-    for row_idx, row_data in enumerate(rows):
-        table_row = table.rows[row_idx + 1]
-        table_row.height_rule = WD_ROW_HEIGHT_RULE.AUTO  # Auto height for data rows
-
-        for col_idx, cell_value in enumerate(row_data):
-            cell = table_row.cells[col_idx]
-            para = cell.paragraphs[0]
-            # Remove paragraph spacing for compact height
-            para.paragraph_format.space_before = Pt(0)
-            para.paragraph_format.space_after = Pt(0)
-            para.paragraph_format.line_spacing = 1.0
-
-            run = para.add_run(str(cell_value))
-            run.font.name = FONT_PRIMARY
-            run.font.size = SIZE_BODY
-            # Add consistent padding (0.19cm) and vertical centre alignment
-            _set_cell_padding(cell, Cm(0.19))
-            _set_vertical_alignment(cell, 'center')
+    for row_data in rows:
+        if len(row_data) > len(headers):
+            raise ValueError(
+                f"Row has {len(row_data)} cells but the table has "
+                f"{len(headers)} columns: {row_data!r}"
+            )
+
+    # Columns share the text width equally (as _add_table() lays them out)
+    col_width = Emu(CONTENT_WIDTH // len(headers)).twips if headers else 0
+
+    # Header row: bold, centred, optionally grey background
+    header_shading = _SHADING_TEMPLATE.format(fill='F2F2F2') if header_bg else ''
+    header_jc = _JC_TEMPLATE.format(align='center')
+    header_xml = _ROW_TEMPLATE.format(cells=''.join(
+        _CELL_TEMPLATE.format(
+            width=col_width, shading=header_shading, jc=header_jc,
+            run=_run_xml(str(header_text), '<w:b/>')
+        )
+        for header_text in headers
+    ))
+
+    # Data rows; short rows are padded with empty cells to the header width
+    rows_xml = ''.join(
+        _ROW_TEMPLATE.format(cells=''.join(
+            _CELL_TEMPLATE.format(
+                width=col_width, shading='', jc='', run=_run_xml(str(cell_value))
+            )
+            for cell_value in row_data
+        ) + _EMPTY_CELL_TEMPLATE.format(width=col_width) * (len(headers) - len(row_data)))
+        for row_data in rows
+    )
 
-    return table
+    tbl = parse_xml(_TBL_TEMPLATE.format(
+        layout='',
+        grid=_GRID_COL_TEMPLATE.format(width=col_width) * len(headers),
+        rows=header_xml + rows_xml
+    ))
+    _append_block(doc, tbl)
+
+    return Table(tbl, doc._body)
 
 
 # =============================================================================
@@ -957,34 +1264,27 @@ def add_instruction_box(doc, text):
         Table object
     """
     # Create a single-cell table for the box
-    table = doc.add_table(rows=1, cols=1)
+    table = _add_table(doc, 1, 1)
     table.autofit = False
     table.columns[0].width = CONTENT_WIDTH
 
-    cell = table.rows[0].cells[0]
+    cell = _row_cells(table)[0]
 
     # Add shading
-    shading_elm = OxmlElement('w:shd')
-    shading_elm.set(qn('w:fill'), 'F2F2F2')
-    cell._element.get_or_add_tcPr().append(shading_elm)
+    _set_cell_shading(cell, 'F2F2F2')
 
     # Add text with instruction style formatting
-    para = cell.paragraphs[0]
-    run = para.add_run(text)
-    run.italic = True
-    run.font.name = FONT_PRIMARY
-    run.font.size = SIZE_BODY
+    para = _cell_paragraph(cell)
+    _add_styled_run(para, text, italic=True)
 
     # Add border
     _set_cell_border(cell, '000000', '8')  # 1pt border
 
     # Add padding (0.19cm = Word default)
-    _set_cell_padding(cell, Cm(0.19))
+    _set_cell_padding_twips(cell, CELL_PADDING_TWIPS)
 
     # Add spacing after the box (reduced 30% from 6pt to 4pt)
-    spacing_para = doc.add_paragraph()
-    spacing_para.paragraph_format.space_before = Pt(0)
-    spacing_para.paragraph_format.space_after = Pt(4)
+    _add_spacer_paragraph(doc, Pt(4))
 
     return table
 
@@ -1003,47 +1303,31 @@ def add_quote_box(doc, text, source=None):
         Table object
     """
     # Create a single-cell table for the box
-    table = doc.add_table(rows=1, cols=1)
+    table = _add_table(doc, 1, 1)
     table.autofit = False
     table.columns[0].width = CONTENT_WIDTH
 
-    cell = table.rows[0].cells[0]
+    cell = _row_cells(table)[0]
 
     # Add cream background
-    shading_elm = OxmlElement('w:shd')
-    shading_elm.set(qn('w:fill'), 'FFFAF0')  # Light cream
-    cell._element.get_or_add_tcPr().append(shading_elm)
+    _set_cell_shading(cell, 'FFFAF0')  # Light cream
 
     # Add text with quote style formatting
-    para = cell.paragraphs[0]
-    run = para.add_run(text)
-    run.italic = True
-    run.font.name = FONT_PRIMARY
-    run.font.size = SIZE_BODY
+    para = _cell_paragraph(cell)
+    _add_styled_run(para, text, italic=True)
     para.paragraph_format.line_spacing = 1.5
 
     # Add source if provided
     if source:
         source_para = cell.add_paragraph()
-        source_run = source_para.add_run(f"— {source}")
-        source_run.font.name = FONT_PRIMARY
-        source_run.font.size = SIZE_CAPTION
+        _add_styled_run(source_para, f"— {source}", size=SIZE_CAPTION)
         source_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
 
     # Add left border only (2pt dark grey)
-    tcPr = cell._tc.get_or_add_tcPr()
-    tcBorders = parse_xml(
-        r'<w:tcBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-        r'<w:top w:val="nil"/>'
-        r'<w:right w:val="nil"/>'
-        r'<w:bottom w:val="nil"/>'
-        r'<w:left w:val="single" w:sz="16" w:color="808080"/>'
-        r'</w:tcBorders>'
-    )
-    tcPr.append(tcBorders)
+    cell._tc.get_or_add_tcPr().append(deepcopy(_QUOTE_TC_BORDERS_EL))
 
     # Add padding
-    _set_cell_padding(cell, Cm(0.5))
+    _set_cell_padding_twips(cell, QUOTE_PADDING_TWIPS)
 
     return table
 
@@ -1059,52 +1343,65 @@ def add_answer_box(doc, text):
     Returns:
         Table object
     """
-    table = doc.add_table(rows=1, cols=1)
+    table = _add_table(doc, 1, 1)
     table.autofit = False
     table.columns[0].width = CONTENT_WIDTH
 
-    cell = table.rows[0].cells[0]
+    cell = _row_cells(table)[0]
 
     # Add text
-    para = cell.paragraphs[0]
-    run = para.add_run(text)
-    run.font.name = FONT_PRIMARY
-    run.font.size = SIZE_BODY
+    para = _cell_paragraph(cell)
+    _add_styled_run(para, text)
 
     # Add border
     _set_cell_border(cell, '000000', '4')  # 0.5pt border
 
     # Add padding
-    _set_cell_padding(cell, Cm(0.3))
+    _set_cell_padding_twips(cell, ANSWER_PADDING_TWIPS)
 
     return table
 
 
-def _set_cell_border(cell, colour, size):
-    """Set all borders on a cell."""
-    tcPr = cell._tc.get_or_add_tcPr()
-    tcBorders = parse_xml(
-        f'<w:tcBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-        f'<w:top w:val="single" w:sz="{size}" w:color="{colour}"/>'
-        f'<w:left w:val="single" w:sz="{size}" w:color="{colour}"/>'
-        f'<w:bottom w:val="single" w:sz="{size}" w:color="{colour}"/>'
-        f'<w:right w:val="single" w:sz="{size}" w:color="{colour}"/>'
-        f'</w:tcBorders>'
-    )
-    tcPr.append(tcBorders)
+@functools.lru_cache(maxsize=16)
+def _tc_borders_template(colour, size):
+    """``w:tcBorders`` with a single line on all sides; deepcopy() before use."""
+    line = (size, colour)
+    return _tc_borders_element(line, line, line, line)
 
 
-def _set_cell_padding(cell, padding):
-    """Set padding on all sides of a cell."""
-    tcPr = cell._tc.get_or_add_tcPr()
+@functools.lru_cache(maxsize=16)
+def _tc_mar_template(padding_twips):
+    """``w:tcMar`` with the same margin on all sides; deepcopy() before use."""
     tcMar = OxmlElement('w:tcMar')
-    padding_twips = int(padding.twips) if hasattr(padding, 'twips') else int(padding * 567)  # Convert cm to twips
     for margin_name in ['top', 'left', 'bottom', 'right']:
         margin = OxmlElement(f'w:{margin_name}')
-        margin.set(qn('w:w'), str(padding_twips))
-        margin.set(qn('w:type'), 'dxa')
+        margin.set(_W_W, str(padding_twips))
+        margin.set(_W_TYPE, 'dxa')
         tcMar.append(margin)
-    tcPr.append(tcMar)
+    return tcMar
+
+
+@functools.lru_cache(maxsize=16)
+def _shading_template(fill):
+    """``w:shd`` with a solid background fill; deepcopy() before use."""
+    shading_elm = OxmlElement('w:shd')
+    shading_elm.set(_W_FILL, fill)
+    return shading_elm
+
+
+def _set_cell_border(cell, colour, size):
+    """Set all borders on a cell."""
+    cell._tc.get_or_add_tcPr().append(deepcopy(_tc_borders_template(colour, size)))
+
+
+def _set_cell_padding_twips(cell, padding_twips):
+    """Set padding on all sides of a cell from a precomputed twips value."""
+    cell._tc.get_or_add_tcPr().append(deepcopy(_tc_mar_template(padding_twips)))
+
+
+def _set_cell_shading(cell, fill):
+    """Set a solid background fill (hex RGB) on a cell."""
+    cell._tc.get_or_add_tcPr().append(deepcopy(_shading_template(fill)))
 
 
 # =============================================================================
@@ -1124,17 +1421,10 @@ def add_question(doc, number, text, bold_number=True):
     Returns:
         Paragraph object
     """
-    para = doc.add_paragraph(style=STYLE_QUESTION)
+    para = _add_paragraph(doc, style=STYLE_QUESTION)
 
-    num_run = para.add_run(f"{number}. ")
-    num_run.font.name = FONT_PRIMARY
-    num_run.font.size = SIZE_QUESTION
-    if bold_number:
-        num_run.bold = True
-
-    text_run = para.add_run(text)
-    text_run.font.name = FONT_PRIMARY
-    text_run.font.size = SIZE_QUESTION
+    _add_styled_run(para, f"{number}. ", size=SIZE_QUESTION, bold=bold_number)
+    _add_styled_run(para, text, size=SIZE_QUESTION)
 
     # Set uniform spacing
     para.paragraph_format.space_before = Pt(0)
@@ -1143,6 +1433,29 @@ def add_question(doc, number, text, bold_number=True):
     return para
 
 
+def add_option(doc, letter, text, last=False):
+    """
+    Add a multiple-choice option (A) B) C) D) style) below a question.
+
+    Formatting comes from the List Paragraph style, so the paragraph carries
+    only a style reference and its text.
+
+    Args:
+        doc: Document object
+        letter: Option letter (e.g., 'A', 'B')
+        text: Option text
+        last: True for a question's final option; adds the space before the
+            next question (no separate spacer paragraph is needed)
+
+    Returns:
+        Paragraph object
+    """
+    para = _add_paragraph(doc, f"{letter}) {text}", style=STYLE_OPTION)
+    if last:
+        para.paragraph_format.space_after = SPACING_AFTER_OPTIONS
+    return para
+
+
 def add_sub_question(doc, letter, text):
     """
     Add a sub-question (a) b) c) style).
@@ -1155,15 +1468,10 @@ def add_sub_question(doc, letter, text):
     Returns:
         Paragraph object
     """
-    para = doc.add_paragraph(style=STYLE_BODY)
+    para = _add_paragraph(doc, style=STYLE_BODY)
 
-    letter_run = para.add_run(f"{letter}) ")
-    letter_run.font.name = FONT_PRIMARY
-    letter_run.font.size = SIZE_BODY
-
-    text_run = para.add_run(text)
-    text_run.font.name = FONT_PRIMARY
-    text_run.font.size = SIZE_BODY
+    _add_styled_run(para, f"{letter}) ")
+    _add_styled_run(para, text)
 
     para.paragraph_format.left_indent = Cm(1.27)
     para.paragraph_format.space_before = Pt(0)
@@ -1183,19 +1491,21 @@ def add_highlighted_text(doc, text, highlight_colour='yellow'):
     Args:
         doc: Document object
         text: Text to highlight
-        highlight_colour: 'yellow' or 'grey'
+        highlight_colour: 'yellow' or 'grey' (anything else raises ValueError)
 
     Returns:
         Paragraph object
     """
-    para = doc.add_paragraph(style=STYLE_BODY)
-    run = para.add_run(text)
+    highlight = _HIGHLIGHT_COLOURS.get(highlight_colour)
+    if highlight is None:
+        raise ValueError(
+            f"Unknown highlight colour: {highlight_colour}. "
+            f"Available colours: {', '.join(_HIGHLIGHT_COLOURS.keys())}"
+        )
 
-    # Set highlight
-    if highlight_colour == 'yellow':
-        run.font.highlight_color = 7  # WD_COLOR_INDEX.YELLOW
-    elif highlight_colour == 'grey':
-        run.font.highlight_color = 15  # WD_COLOR_INDEX.GRAY_25
+    para = _add_paragraph(doc, style=STYLE_BODY)
+    run = para.add_run(text)
+    run.font.highlight_color = highlight
 
     return para
 
@@ -1214,7 +1524,7 @@ def add_horizontal_rule(doc):
     Returns:
         Paragraph object
     """
-    para = doc.add_paragraph()
+    para = _add_paragraph(doc)
     para.paragraph_format.space_before = Pt(6)
     para.paragraph_format.space_after = Pt(6)
 
@@ -1222,9 +1532,9 @@ def add_horizontal_rule(doc):
     pPr = para._p.get_or_add_pPr()
     pBdr = OxmlElement('w:pBdr')
     bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '4')
-    bottom.set(qn('w:color'), '000000')
+    bottom.set(_W_VAL, 'single')
+    bottom.set(_W_SZ, '4')
+    bottom.set(_W_COLOR, '000000')
     pBdr.append(bottom)
     pPr.append(pBdr)
 
@@ -1238,7 +1548,7 @@ def add_page_break(doc):
     Args:
         doc: Document object
     """
-    doc.add_page_break()
+    _add_paragraph(doc).add_run().add_break(WD_BREAK.PAGE)
 
 
 # =============================================================================
@@ -1258,7 +1568,7 @@ def add_checklist(doc, items):
     """
     paragraphs = []
     for item in items:
-        para = doc.add_paragraph(style=STYLE_BODY)
+        para = _add_paragraph(doc, style=STYLE_BODY)
         run = para.add_run(f"\u2610 {item}")  # Unicode checkbox
         para.paragraph_format.line_spacing = 1.5
         paragraphs.append(para)
@@ -1283,7 +1593,7 @@ def add_body_paragraph(doc, text, bold=False, italic=False):
     Returns:
         Paragraph object
     """
-    para = doc.add_paragraph(style=STYLE_BODY)
+    para = _add_paragraph(doc, style=STYLE_BODY)
     run = para.add_run(text)
     run.bold = bold
     run.italic = italic
@@ -1308,83 +1618,171 @@ def add_caption(doc, text, figure_number=None):
     else:
         caption_text = text
 
-    return doc.add_paragraph(caption_text, style=STYLE_CAPTION)
+    return _add_paragraph(doc, caption_text, style=STYLE_CAPTION)
 
 
-def _set_vertical_alignment(cell, align='center'):
+def _run_xml(text, rpr_xml=''):
     """
-    Set vertical alignment for a cell.
-    align: 'top', 'center', 'bottom'
+    Return ``w:r`` XML for text, with optional ``w:rPr`` children.
+
+    Mirrors Run.add_run(): tabs become ``w:tab``, line breaks ``w:br``, and
+    text with leading/trailing spaces keeps them via xml:space="preserve".
     """
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
+    content = []
+    for part in _RUN_SPECIAL_CHARS.split(text):
+        if part == '\t':
+            content.append('<w:tab/>')
+        elif part in ('\r', '\n'):
+            content.append('<w:br/>')
+        elif part:
+            space = ' xml:space="preserve"' if part != part.strip() else ''
+            content.append(f'<w:t{space}>{escape(part)}</w:t>')
+    rpr = f'<w:rPr>{rpr_xml}</w:rPr>' if rpr_xml else ''
+    return f'<w:r>{rpr}{"".join(content)}</w:r>'
+
+
+@functools.lru_cache(maxsize=16)
+def _styled_rpr(size, bold, italic):
+    """
+    Parsed ``w:rPr`` holding only the overrides for a run; callers insert
+    deepcopy() clones. Returns None when the run needs no overrides.
 
-    # Remove any existing vAlign
-    for child in tcPr.xpath('w:vAlign'):
-        tcPr.remove(child)
+    Font and body size come from w:docDefaults (FONT_PRIMARY, SIZE_BODY), so
+    they are only written when the run differs from them.
+    """
+    overrides = (
+        f'{"<w:b/>" if bold else ""}{"<w:i/>" if italic else ""}'
+        f'{"" if size == SIZE_BODY else f"""<w:sz w:val="{round(size.pt * 2)}"/>"""}'
+    )
+    if not overrides:
+        return None
+    return parse_xml(f'<w:rPr {_W_NSDECL}>{overrides}</w:rPr>')
 
-    vAlign = OxmlElement('w:vAlign')
-    vAlign.set(qn('w:val'), align)
-    tcPr.append(vAlign)
 
+def _add_styled_run(para, text, size=SIZE_BODY, bold=False, italic=False):
+    """
+    Add a run in the document font at the given size.
+
+    Only true overrides (bold, italic, non-body size) are written to the run;
+    everything else is inherited from the document defaults. The run
+    properties go in as a single cloned element.
 
-def _set_cell_margins(cell, top=None, start=None, bottom=None, end=None):
+    Returns:
+        Run object
     """
-    Set internal padding for a cell (in twips).
-    1440 twips = 1 inch
-    108 twips = ~0.19 cm
+    run = para.add_run(text)
+    rPr = _styled_rpr(size, bold, italic)
+    if rPr is not None:
+        run._r.insert(0, deepcopy(rPr))
+    return run
+
+
+def _append_block(doc, element):
     """
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
+    Append a block-level element (``w:p``, ``w:tbl``) to the end of the body.
 
-    # Remove any existing tcMar
-    for child in tcPr.xpath('w:tcMar'):
-        tcPr.remove(child)
+    The body's last child is normally its ``w:sectPr``, so the element goes
+    straight in front of it. python-docx's own add_paragraph()/add_table()
+    search the body's children for the sectPr on every insert, which makes
+    building a long document quadratic.
 
-    tcMar = OxmlElement('w:tcMar')
+    Returns:
+        The inserted element
+    """
+    body = doc.element.body
+    last = next(body.iterchildren(reversed=True), None)
+    if last is not None and last.tag == _W_SECT_PR:
+        last.addprevious(element)
+    else:
+        body.append(element)
+    return element
 
-    for side, value in [('top', top), ('left', start), ('bottom', bottom), ('right', end)]:
-        if value is not None:
-            node = OxmlElement(f'w:{side}')
-            node.set(qn('w:w'), str(value))
-            node.set(qn('w:type'), 'dxa')
-            tcMar.append(node)
 
-    tcPr.append(tcMar)
+def _add_paragraph(doc, text='', style=None):
+    """Equivalent of doc.add_paragraph(), appended via _append_block()."""
+    para = Paragraph(_append_block(doc, OxmlElement('w:p')), doc._body)
+    if text:
+        para.add_run(text)
+    if style is not None:
+        para.style = style
+    return para
 
 
-def _remove_style_borders(style):
+def _add_table(doc, rows, cols):
     """
-    Remove all borders from a style using XML.
-    Necessary for some Word versions that default to having borders (like the blue line).
+    Equivalent of doc.add_table(), appended via _append_block().
+
+    Columns share CONTENT_WIDTH (the setup_document() text width) equally.
     """
-    pPr = style.element.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    for bdr in ['top', 'left', 'bottom', 'right', 'between', 'bar']:
-        el = OxmlElement(f'w:{bdr}')
-        el.set(qn('w:val'), 'nil')
-        pBdr.append(el)
-    pPr.append(pBdr)
+    tbl = _append_block(doc, CT_Tbl.new_tbl(rows, cols, CONTENT_WIDTH))
+    return Table(tbl, doc._body)
 
 
-def _set_style_font_xml(style, font_name):
+@functools.lru_cache(maxsize=8)
+def _spacer_template(space_after_twips):
+    """Empty ``w:p`` with no space before and the given space after; deepcopy() before use."""
+    return parse_xml(
+        f'<w:p {_W_NSDECL}><w:pPr>'
+        f'<w:spacing w:before="0" w:after="{space_after_twips}"/>'
+        '</w:pPr></w:p>'
+    )
+
+
+def _add_spacer_paragraph(doc, space_after):
+    """
+    Add an empty paragraph that only provides vertical space after a block.
+
+    The paragraph is needed rather than spacing on the table itself: Word
+    merges adjacent tables with nothing between them into one table, and
+    table rows have no space-after property.
+    """
+    _append_block(doc, deepcopy(_spacer_template(int(space_after.twips))))
+
+
+def _patch_style_xml(styles_element):
     """
-    Ensure font is set at XML level for the style.
-    This ensures Word properly applies the font even if the display name differs.
+    Apply the XML-level style fixes in a single sweep over w:styles.
+
+    For each style listed in _STYLE_XML_PATCHES:
+    - Set the font at XML level for all font types (ASCII, HAnsi, EastAsia, CS),
+      so Word applies it even where the template uses theme fonts
+    - Optionally remove all paragraph borders. Necessary for some Word
+      versions that default to having borders (like the blue line under Title)
     """
-    rPr = style.element.get_or_add_rPr()
+    for style_el in styles_element.findall(_W_STYLE):
+        patch = _STYLE_XML_PATCHES.get(style_el.get(_W_STYLE_ID))
+        if patch is None:
+            continue
+        font_name, remove_borders = patch
+
+        if remove_borders:
+            pPr = style_el.get_or_add_pPr()
+            pBdr = deepcopy(_NIL_PBDR_EL)
+            existing = pPr.find(_W_PBDR)
+            if existing is not None:
+                pPr.replace(existing, pBdr)
+            else:
+                pPr.insert_element_before(pBdr, *_PBDR_SUCCESSORS)
+
+        # Replace any existing font settings in place
+        rPr = style_el.get_or_add_rPr()
+        rFonts = deepcopy(_rfonts_template(font_name))
+        existing = rPr.find(_W_RFONTS)
+        if existing is not None:
+            rPr.replace(existing, rFonts)
+        else:
+            rPr.insert(0, rFonts)
 
-    # Remove existing font settings
-    for rFont in rPr.findall(qn('w:rFonts')):
-        rPr.remove(rFont)
 
-    # Add new font settings for all font types (ASCII, HAnsi, EastAsia, CS)
+@functools.lru_cache(maxsize=16)
+def _rfonts_template(font_name):
+    """``w:rFonts`` naming font_name for all four font slots; deepcopy() before use."""
     rFonts = OxmlElement('w:rFonts')
-    rFonts.set(qn('w:ascii'), font_name)
-    rFonts.set(qn('w:hAnsi'), font_name)
-    rFonts.set(qn('w:eastAsia'), font_name)
-    rFonts.set(qn('w:cs'), font_name)
-    rPr.insert(0, rFonts)
+    rFonts.set(_W_ASCII, font_name)
+    rFonts.set(_W_HANSI, font_name)
+    rFonts.set(_W_EAST_ASIA, font_name)
+    rFonts.set(_W_CS, font_name)
+    return rFonts
 
 
 def save_document(doc, filepath):
@@ -1399,6 +1797,64 @@ def save_document(doc, filepath):
     print(f"[SUCCESS] Document saved: {filepath}")
 
 
+def save_document_to_stream(doc, max_size=5 * 1024 * 1024):
+    """
+    Save document to a file-like object, rewound and ready to read.
+
+    Small documents stay in memory; anything over max_size spills to a
+    temporary file instead of being held as a second in-memory copy.
+
+    Args:
+        doc: Document object
+        max_size: Bytes kept in memory before spilling to disk (default 5MB)
+
+    Returns:
+        SpooledTemporaryFile positioned at the start of the DOCX data
+    """
+    stream = tempfile.SpooledTemporaryFile(max_size=max_size)
+    doc.save(stream)
+    stream.seek(0)
+    return stream
+
+
+# Serialised blank documents, one per colour scheme, and the shared element
+# templates. Built at import so style setup and first-use XML parsing never
+# run on a request; set DOCX_STYLES_NO_PREBUILD to build lazily
+# (e.g. for tooling that imports this module without generating documents).
+_BLANKS = {}
+
+
+def _warm_templates():
+    """
+    Fill the element-template caches the builders hit on every document.
+
+    The module-level parse_xml() calls above have already initialised
+    python-docx's shared parser; this moves the remaining first-use parses
+    (box padding and borders, spacers, run overrides) to import time too.
+    """
+    for padding_twips in (CELL_PADDING_TWIPS, QUOTE_PADDING_TWIPS, ANSWER_PADDING_TWIPS):
+        _tc_mar_template(padding_twips)
+    for colour, size in (('000000', '8'), ('000000', '4')):
+        _tc_borders_template(colour, size)
+    for fill in ('F2F2F2', 'FFFAF0'):
+        _shading_template(fill)
+    for space_after in (SPACING_AFTER_PARA, Pt(4)):
+        _spacer_template(int(space_after.twips))
+    for size, bold, italic in (
+        (SIZE_BODY, False, True),
+        (SIZE_BODY, True, False),
+        (SIZE_CAPTION, False, False),
+        (SIZE_QUESTION, False, False),
+        (SIZE_QUESTION, True, False),
+    ):
+        _styled_rpr(size, bold, italic)
+
+
+if not os.environ.get('DOCX_STYLES_NO_PREBUILD'):
+    _BLANKS.update((name, _build_blank(name)) for name in COLOUR_SCHEMES)
+    _warm_templates()
+
+
 # =============================================================================
 # STYLE REFERENCE
 # =============================================================================
@@ -1409,16 +1865,17 @@ BUILT-IN STYLES MODIFIED BY THIS MODULE
 This module modifies Word's built-in styles at document creation time.
 Changes are document-scoped and do NOT affect Word's global defaults.
 
-| Style Name   | Element Type        | Font          | Size | Weight  | Other           |
-|--------------|---------------------|---------------|------|---------|-----------------|
-| Title        | Document title      | Aptos Display | 20pt | Bold    | Centre          |
-| Subtitle     | Subtitle            | Aptos         | 14pt | Bold    | Centre          |
-| Heading 1    | Main heading        | Aptos Display | 16pt | Bold    | Left            |
-| Heading 2    | Section heading     | Aptos Display | 14pt | Bold    | Left            |
-| Heading 3    | Subsection heading  | Aptos         | 12pt | Bold    | Left            |
-| Normal       | Body text           | Aptos         | 12pt | Regular | Left            |
-| Quote        | Quote/extract       | Aptos         | 12pt | Italic  | Line spacing 1.5|
-| Caption      | Image caption       | Aptos         | 10pt | Italic  | Centre, grey    |
+| Style Name     | Element Type        | Font          | Size | Weight  | Other                     |
+|----------------|---------------------|---------------|------|---------|---------------------------|
+| Title          | Document title      | Aptos Display | 20pt | Bold    | Centre                    |
+| Subtitle       | Subtitle            | Aptos         | 14pt | Bold    | Centre                    |
+| Heading 1      | Main heading        | Aptos Display | 16pt | Bold    | Left                      |
+| Heading 2      | Section heading     | Aptos Display | 14pt | Bold    | Left                      |
+| Heading 3      | Subsection heading  | Aptos         | 12pt | Bold    | Left                      |
+| Normal         | Body text           | Aptos         | 12pt | Regular | Left                      |
+| Quote          | Quote/extract       | Aptos         | 12pt | Italic  | Line spacing 1.5          |
+| Caption        | Image caption       | Aptos         | 10pt | Italic  | Centre, grey              |
+| List Paragraph | Quiz option         | Aptos         | 11pt | Regular | Indent 1.27cm, 6pt after  |
 
 WHY BUILT-IN STYLES?
 ====================
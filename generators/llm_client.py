@@ -4,9 +4,34 @@ LLM Client for English Resource Generator.
 Wraps Google Gemini API with error handling and retry logic.
 """
 
+import asyncio
+import random
+import re
+import threading
+import time
+
 import streamlit as st
-import google.generativeai as genai
-from typing import Optional
+from typing import Iterator, List, Optional
+
+# Rate-limit retries: exponential backoff (1s, 2s, 4s, ... capped at 10s) plus
+# up to 1s of jitter so concurrent requests don't retry in lockstep. Other
+# errors (bad key, safety filter, missing model) are not transient and are
+# raised immediately.
+MAX_ATTEMPTS = 4
+BACKOFF_INITIAL = 1.0
+BACKOFF_MAX = 10.0
+# Deadline for a whole API call in seconds. On the gRPC transport it covers
+# the full response, streamed chunks included, so it must allow for a long
+# quiz (~4000 output tokens) rather than just the time to first byte.
+REQUEST_TIMEOUT = 180
+
+# Message patterns for _classify_error()
+_RATE_LIMIT_RE = re.compile(r"\b(?:429|rate limit|quota)\b")
+_FINISH_REASON_RE = re.compile(r"finish_?reason\S* is (\w+)")
+# Candidate finish reasons that mean the response was withheld by a filter
+_FILTERED_FINISH_REASONS = frozenset(
+    {"SAFETY", "RECITATION", "BLOCKLIST", "PROHIBITED_CONTENT", "SPII"}
+)
 
 
 class GeminiClient:
@@ -14,6 +39,9 @@ class GeminiClient:
 
     def __init__(self):
         """Initialise the Gemini client with API key from secrets."""
+        # Imported here so pages that never generate don't load the SDK
+        import google.generativeai as genai
+
         try:
             api_key = st.secrets.gemini.api_key
         except (KeyError, AttributeError):
@@ -50,39 +78,194 @@ class GeminiClient:
         Raises:
             Exception: If generation fails after retries.
         """
-        try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config={
-                    "max_output_tokens": max_tokens,
-                    "temperature": temperature
-                }
-            )
-            return response.text
-        except Exception as e:
-            error_msg = str(e).lower()
-            full_error = str(e)
-            if "404" in error_msg or "not found" in error_msg:
-                raise GenerationError(
-                    f"Model not available. Details: {full_error[:300]}"
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                response = self.model.generate_content(
+                    prompt,
+                    generation_config=self._generation_config(max_tokens, temperature),
+                    request_options={"timeout": REQUEST_TIMEOUT}
                 )
-            elif "rate" in error_msg or "quota" in error_msg:
-                raise RateLimitError(
-                    f"Rate limit reached. Please wait a few minutes and try again. "
-                    f"(Details: {full_error[:200]})"
-                )
-            elif "invalid" in error_msg and "key" in error_msg:
-                raise GenerationError(
-                    "Invalid API key. Please check your Gemini API key in Streamlit secrets."
+                return response.text
+            except Exception as e:
+                error = _classify_error(e)
+                if not isinstance(error, RateLimitError) or attempt == MAX_ATTEMPTS - 1:
+                    raise error
+            time.sleep(_backoff_delay(attempt))
+
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 4000,
+        temperature: float = 0.7
+    ) -> Iterator[str]:
+        """
+        Generate content using Gemini, yielding text as it arrives.
+
+        Args:
+            prompt: The prompt to send to the model.
+            max_tokens: Maximum tokens in response.
+            temperature: Creativity level (0.0-1.0).
+
+        Yields:
+            Chunks of generated text, in order.
+
+        Rate-limit errors raised before the first chunk are retried with the
+        same backoff as generate(); once text has been yielded the caller
+        holds a partial response, so later errors are raised as they occur.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            yielded = False
+            try:
+                response = self.model.generate_content(
+                    prompt,
+                    generation_config=self._generation_config(max_tokens, temperature),
+                    stream=True,
+                    request_options={"timeout": REQUEST_TIMEOUT}
                 )
-            elif "api_key" in error_msg or "api key" in error_msg:
-                raise GenerationError(
-                    f"API key issue: {full_error[:200]}"
+                for chunk in response:
+                    yielded = True
+                    yield chunk.text
+                return
+            except Exception as e:
+                error = _classify_error(e)
+                if (
+                    yielded
+                    or not isinstance(error, RateLimitError)
+                    or attempt == MAX_ATTEMPTS - 1
+                ):
+                    raise error
+            time.sleep(_backoff_delay(attempt))
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 4000,
+        temperature: float = 0.7
+    ) -> str:
+        """
+        Async counterpart of generate(), with the same rate-limit retries.
+
+        Awaiting several of these together (e.g. with asyncio.gather) overlaps
+        their network round trips; see generate_batch().
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=self._generation_config(max_tokens, temperature),
+                    request_options={"timeout": REQUEST_TIMEOUT}
                 )
-            elif "safety" in error_msg or "blocked" in error_msg:
-                raise ContentFilterError("Content was filtered. Try rephrasing the topic.")
-            else:
-                raise GenerationError(f"Generation failed: {full_error[:300]}")
+                return response.text
+            except Exception as e:
+                error = _classify_error(e)
+                if not isinstance(error, RateLimitError) or attempt == MAX_ATTEMPTS - 1:
+                    raise error
+            await asyncio.sleep(_backoff_delay(attempt))
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        max_tokens: int = 4000,
+        temperature: float = 0.7
+    ) -> List[str]:
+        """
+        Generate content for several prompts concurrently.
+
+        Requests are issued together, so total time is roughly that of the
+        slowest prompt rather than the sum (subject to API quota).
+
+        Args:
+            prompts: The prompts to send to the model.
+            max_tokens: Maximum tokens in each response.
+            temperature: Creativity level (0.0-1.0).
+
+        Returns:
+            Generated text for each prompt, in input order.
+        """
+        async def run_all():
+            return await asyncio.gather(
+                *(self.agenerate(p, max_tokens, temperature) for p in prompts)
+            )
+
+        return asyncio.run(run_all())
+
+    @staticmethod
+    def _generation_config(max_tokens: int, temperature: float) -> dict:
+        """Build the Gemini generation config."""
+        return {
+            "max_output_tokens": max_tokens,
+            "temperature": temperature
+        }
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt + 1``."""
+    return min(BACKOFF_INITIAL * 2 ** attempt, BACKOFF_MAX) + random.uniform(0, 1)
+
+
+def _classify_error(e: Exception) -> Exception:
+    """
+    Map a Gemini API exception to the matching client error.
+
+    Responses withheld by a filter are checked first: the SDK raises those as
+    ValueErrors whose message links to .../generate-content#finishreason, so
+    a loose substring test would read "generate" as a rate limit and retry a
+    refusal. Rate limits are recognised by exception type (HTTP 429) or by
+    whole words in the message.
+    """
+    from google.api_core import exceptions as api_exceptions
+
+    error_msg = str(e).lower()
+    full_error = str(e)
+    if _is_filtered(e, error_msg):
+        return ContentFilterError("Content was filtered. Try rephrasing the topic.")
+    elif (
+        isinstance(e, (api_exceptions.ResourceExhausted, api_exceptions.TooManyRequests))
+        or _RATE_LIMIT_RE.search(error_msg)
+    ):
+        return RateLimitError(
+            f"Rate limit reached. Please wait a few minutes and try again. "
+            f"(Details: {full_error[:200]})"
+        )
+    elif "404" in error_msg or "not found" in error_msg:
+        return GenerationError(
+            f"Model not available. Details: {full_error[:300]}"
+        )
+    elif "invalid" in error_msg and "key" in error_msg:
+        return GenerationError(
+            "Invalid API key. Please check your Gemini API key in Streamlit secrets."
+        )
+    elif "api_key" in error_msg or "api key" in error_msg:
+        return GenerationError(
+            f"API key issue: {full_error[:200]}"
+        )
+    else:
+        return GenerationError(f"Generation failed: {full_error[:300]}")
+
+
+def _is_filtered(e: Exception, error_msg: str) -> bool:
+    """True if the error reports a prompt or response blocked by a filter."""
+    from google.api_core import exceptions as api_exceptions
+    from google.generativeai import protos
+    from google.generativeai.types import BlockedPromptException, StopCandidateException
+
+    if isinstance(e, (BlockedPromptException, StopCandidateException)):
+        return True
+    # API call failures (bad key, quota, ...) can mention "blocked" too
+    if isinstance(e, api_exceptions.GoogleAPICallError):
+        return False
+    if "safety" in error_msg or "blocked" in error_msg:
+        return True
+    finish = _FINISH_REASON_RE.search(error_msg)
+    if not finish:
+        return False
+    reason = finish.group(1)
+    if reason.isdigit():
+        try:
+            reason = protos.Candidate.FinishReason(int(reason)).name
+        except ValueError:
+            return False
+    return reason.upper() in _FILTERED_FINISH_REASONS
 
 
 class RateLimitError(Exception):
@@ -100,22 +283,24 @@ class GenerationError(Exception):
     pass
 
 
-@st.cache_resource
-def get_llm_client(_api_key_hash: str = None) -> GeminiClient:
-    """Get a cached LLM client instance.
-
-    Args:
-        _api_key_hash: Hash of API key to bust cache when key changes.
-    """
-    return GeminiClient()
+# Process-wide client, created on first use. The API key is read once when the
+# client is built; call reload_client() after rotating it.
+_CLIENT_SINGLETON: Optional[GeminiClient] = None
+_CLIENT_LOCK = threading.Lock()
 
 
 def get_client() -> GeminiClient:
-    """Get LLM client, busting cache if API key changed."""
-    try:
-        api_key = st.secrets.gemini.api_key
-        # Use first/last 4 chars as cache key (don't expose full key)
-        key_hash = f"{api_key[:4]}...{api_key[-4:]}"
-    except Exception:
-        key_hash = "default"
-    return get_llm_client(_api_key_hash=key_hash)
+    """Get the shared LLM client, creating it on first use."""
+    global _CLIENT_SINGLETON
+    client = _CLIENT_SINGLETON
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT_SINGLETON = _CLIENT_SINGLETON or GeminiClient()
+    return client
+
+
+def reload_client() -> None:
+    """Drop the shared client so the next get_client() re-reads the API key."""
+    global _CLIENT_SINGLETON
+    with _CLIENT_LOCK:
+        _CLIENT_SINGLETON = None
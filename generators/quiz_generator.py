@@ -2,44 +2,74 @@
 Quiz Generator for English Resource Generator.
 
 Generates multiple-choice quizzes using Gemini and converts to DOCX.
+
+DOCX assembly is cached on disk (st.cache_data, persist="disk") so it
+survives container restarts. The cache key is the tuple of arguments to
+build_quiz_docx_bytes(): the parsed quiz dict (title, text_name,
+year_level, questions, answer_key, teacher_notes), the header year level,
+the text name and DOCX_FORMAT_KEY, a fingerprint of the layout code that
+retires persisted entries when the document format changes. All are plain
+serialisable values; Document objects never enter the cache.
+
+The prompt files and knowledge/index.json are read through st.cache_data
+(refreshed hourly), so reruns and concurrent sessions share one parsed copy.
 """
 
+import functools
+import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from io import BytesIO
-from typing import Dict, Optional
+from tempfile import SpooledTemporaryFile
+from typing import Callable, Dict, Iterator, List, Optional
 
 import streamlit as st
 
 from generators.llm_client import get_client, RateLimitError, ContentFilterError, GenerationError
-from docx_generation.docx_styles import (
-    setup_document,
-    add_header_footer,
-    add_title,
-    add_subtitle,
-    add_subsection_heading,
-    add_question,
-    add_body_paragraph,
-    add_content_table,
-    add_horizontal_rule,
-    add_page_break,
-    save_document
-)
+
+# Line markers for parse_quiz_content(). Metadata values follow the marker
+# on the same line; a question is its heading, a stem (which may span blank
+# lines), then options A-D, each starting its own line and possibly wrapping
+# onto the lines below or separated by blank lines.
+_TITLE_MARKER = "# Quiz: "
+_TEXT_MARKER = "**Text**: "
+_YEAR_MARKER = "**Year Level**: "
+_NOTES_HEADING_RE = re.compile(r"^#{2,3} Teacher Notes[ \t]*$", re.MULTILINE)
+_QUESTION_HEADING_RE = re.compile(r"### Question (\d+)[ \t]*")
+_OPTION_PREFIXES = (("A", "A) "), ("B", "B) "), ("C", "C) "), ("D", "D) "))
+_ANSWER_RE = re.compile(r"\| (\d+) \| ([A-D]) \| (.+?) \|")
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def load_prompt_template() -> str:
     """Load the quiz prompt template."""
     prompt_path = Path(__file__).parent.parent / "prompts" / "quiz.txt"
     return prompt_path.read_text(encoding="utf-8")
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def load_pedagogy_core() -> str:
     """Load the core pedagogy requirements."""
     pedagogy_path = Path(__file__).parent.parent / "prompts" / "pedagogy_core.txt"
     return pedagogy_path.read_text(encoding="utf-8")
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def load_quiz_prompt() -> str:
+    """
+    Load the quiz prompt template with the pedagogy requirements filled in.
+
+    The pedagogy block is the same for every quiz, so it is substituted once
+    here (braces escaped, so it survives the later str.format()) and each
+    prompt only formats the per-request fields.
+    """
+    pedagogy_core = load_pedagogy_core().replace("{", "{{").replace("}", "}}")
+    return load_prompt_template().replace("{pedagogy_core}", pedagogy_core)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
 def load_text_index() -> Dict:
     """Load the text index."""
     index_path = Path(__file__).parent.parent / "knowledge" / "index.json"
@@ -47,42 +77,47 @@ def load_text_index() -> Dict:
         return json.load(f)
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def _text_by_id() -> Dict:
+    """Map each text's ID to its entry in the text index."""
+    return {text["id"]: text for text in load_text_index()["texts"]}
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def texts_by_year() -> Dict[str, List[Dict]]:
+    """Map each year level ID to its texts, in index order."""
+    by_year = {}
+    for text in load_text_index()["texts"]:
+        by_year.setdefault(text["year"], []).append(text)
+    return by_year
+
+
 def get_text_info(text_id: str) -> Optional[Dict]:
     """Get information about a specific text."""
-    index = load_text_index()
-    for text in index["texts"]:
-        if text["id"] == text_id:
-            return text
-    return None
+    return _text_by_id().get(text_id)
 
 
-def generate_quiz(
+def build_quiz_prompt(
     year_level: str,
-    text_id: str,
+    text_info: Dict,
     topic: str,
-    num_questions: int = 10
+    num_questions: int,
+    prompt_template: str
 ) -> str:
     """
-    Generate a quiz using Gemini.
+    Fill the quiz prompt template for one text and topic.
 
     Args:
         year_level: Year level (e.g., "10", "11")
-        text_id: ID of the text from index.json
+        text_info: The text's entry from index.json
         topic: Quiz topic
         num_questions: Number of questions (5-15)
+        prompt_template: The quiz prompt with pedagogy already filled in
+            (see load_quiz_prompt())
 
     Returns:
-        Generated quiz content as markdown.
+        The complete prompt.
     """
-    # Get text info
-    text_info = get_text_info(text_id)
-    if not text_info:
-        raise ValueError(f"Text not found: {text_id}")
-
-    # Load templates
-    prompt_template = load_prompt_template()
-    pedagogy_core = load_pedagogy_core()
-
     # Build knowledge context (placeholder - will be enhanced later)
     knowledge_context = f"""
 Text: {text_info['name']}
@@ -91,20 +126,172 @@ Year Level: Year {year_level}
 Available Resources: {', '.join(text_info.get('resources', []))}
 """
 
-    # Format the prompt
-    prompt = prompt_template.format(
+    return prompt_template.format(
         year_level=f"Year {year_level}",
         text_name=text_info["name"],
         text_type=text_info["type"],
         topic=topic,
         num_questions=num_questions,
-        pedagogy_core=pedagogy_core,
         knowledge_context=knowledge_context
     )
 
+
+def generate_quiz(
+    year_level: str,
+    text_info: Dict,
+    topic: str,
+    num_questions: int,
+    prompt_template: str,
+    nonce: int = 0
+) -> str:
+    """
+    Generate a quiz using Gemini.
+
+    The text entry and template are passed in rather than loaded here, so a
+    caller that already has them makes no further index or file lookups.
+
+    Args:
+        year_level: Year level (e.g., "10", "11")
+        text_info: The text's entry from index.json
+        topic: Quiz topic
+        num_questions: Number of questions (5-15)
+        prompt_template: The quiz prompt with pedagogy filled in
+            (see load_quiz_prompt())
+        nonce: Cache-busting value; identical requests with the same nonce
+            reuse an earlier result (see _cached_generate())
+
+    Returns:
+        Generated quiz content as markdown.
+    """
+    prompt = build_quiz_prompt(
+        year_level, text_info, topic, num_questions, prompt_template
+    )
+
     # Generate with LLM
+    return _cached_generate(prompt, max_tokens=4000, temperature=0.7, nonce=nonce)
+
+
+# Most recent generations kept in _generation_cache(); older ones are evicted.
+_GENERATION_CACHE_SIZE = 64
+_GENERATION_CACHE_LOCK = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False, ttl=86400)
+def _generation_cache() -> "OrderedDict[tuple, str]":
+    """
+    Generated markdown shared across sessions, keyed by
+    (prompt, max_tokens, temperature) in least-recently-used order.
+    Cleared daily.
+
+    A plain mapping rather than st.cache_data so that streamed generations
+    (which can't run inside a cached function) can fill it too.
+    """
+    return OrderedDict()
+
+
+def _cache_get(key: tuple) -> Optional[str]:
+    """Return a cached generation and mark it recently used."""
+    cache = _generation_cache()
+    with _GENERATION_CACHE_LOCK:
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+
+def _cache_put(key: tuple, content: str) -> None:
+    """Store a generation, evicting the least recently used beyond the cap."""
+    cache = _generation_cache()
+    with _GENERATION_CACHE_LOCK:
+        cache[key] = content
+        cache.move_to_end(key)
+        while len(cache) > _GENERATION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _cached_generate(prompt: str, max_tokens: int, temperature: float, nonce: int = 0) -> str:
+    """
+    Generate content, reusing an earlier result for an identical request.
+
+    Teachers asking for the same quiz share one API call. A non-zero nonce
+    forces a fresh generation, which is neither read from nor stored in the
+    cache since no later request could ask for it again.
+    """
+    if nonce:
+        return get_client().generate(prompt, max_tokens=max_tokens, temperature=temperature)
+
+    key = (prompt, max_tokens, temperature)
+    content = _cache_get(key)
+    if content is None:
+        content = get_client().generate(prompt, max_tokens=max_tokens, temperature=temperature)
+        _cache_put(key, content)
+    return content
+
+
+def _cached_generate_stream(
+    prompt: str,
+    max_tokens: int,
+    temperature: float,
+    nonce: int = 0
+) -> Iterator[str]:
+    """
+    Streaming counterpart of _cached_generate().
+
+    A cached result is yielded as a single chunk. Otherwise chunks are passed
+    through as they arrive and the joined text is cached once the stream
+    completes, so an interrupted stream is never reused.
+    """
+    if nonce:
+        yield from get_client().generate_stream(prompt, max_tokens=max_tokens, temperature=temperature)
+        return
+
+    key = (prompt, max_tokens, temperature)
+    content = _cache_get(key)
+    if content is not None:
+        yield content
+        return
+
+    chunks = []
+    for chunk in get_client().generate_stream(prompt, max_tokens=max_tokens, temperature=temperature):
+        chunks.append(chunk)
+        yield chunk
+    _cache_put(key, "".join(chunks))
+
+
+def generate_quiz_batch(tasks: List[Dict]) -> List[str]:
+    """
+    Generate several quizzes concurrently.
+
+    All requests are sent together through the client's async API, so the
+    batch takes roughly as long as its slowest quiz rather than the sum.
+
+    Args:
+        tasks: One dict per quiz with keys year_level, text_id, topic and,
+            optionally, num_questions (default 10).
+
+    Returns:
+        Generated quiz content as markdown, in task order.
+
+    Raises:
+        ValueError: If a task names a text that is not in the index.
+    """
+    prompt_template = load_quiz_prompt()
+
+    prompts = []
+    for task in tasks:
+        text_info = get_text_info(task["text_id"])
+        if not text_info:
+            raise ValueError(f"Text not found: {task['text_id']}")
+        prompts.append(build_quiz_prompt(
+            task["year_level"],
+            text_info,
+            task["topic"],
+            task.get("num_questions", 10),
+            prompt_template
+        ))
+
     client = get_client()
-    return client.generate(prompt, max_tokens=4000, temperature=0.7)
+    return client.generate_batch(prompts, max_tokens=4000, temperature=0.7)
 
 
 def parse_quiz_content(content: str) -> Dict:
@@ -126,56 +313,96 @@ def parse_quiz_content(content: str) -> Dict:
         "teacher_notes": ""
     }
 
-    # Extract title
-    title_match = re.search(r"# Quiz: (.+)", content)
-    if title_match:
-        result["title"] = title_match.group(1).strip()
-
-    # Extract text and year level
-    text_match = re.search(r"\*\*Text\*\*: (.+)", content)
-    if text_match:
-        result["text_name"] = text_match.group(1).strip()
-
-    year_match = re.search(r"\*\*Year Level\*\*: (.+)", content)
-    if year_match:
-        result["year_level"] = year_match.group(1).strip()
-
-    # Extract questions
-    question_pattern = r"### Question (\d+)\n(.+?)\n\nA\) (.+?)\nB\) (.+?)\nC\) (.+?)\nD\) (.+?)(?=\n---|\n### |$)"
-    questions = re.findall(question_pattern, content, re.DOTALL)
-
-    for q in questions:
-        result["questions"].append({
-            "number": int(q[0]),
-            "text": q[1].strip(),
-            "options": {
-                "A": q[2].strip(),
-                "B": q[3].strip(),
-                "C": q[4].strip(),
-                "D": q[5].strip()
-            }
-        })
-
-    # Extract answer key
-    answer_pattern = r"\| (\d+) \| ([A-D]) \| (.+?) \|"
-    answers = re.findall(answer_pattern, content)
-
-    for a in answers:
-        result["answer_key"].append({
-            "question": int(a[0]),
-            "answer": a[1],
-            "explanation": a[2].strip()
-        })
-
-    # Extract teacher notes (everything after "## Teacher Notes")
-    notes_match = re.search(r"## Teacher Notes\n(.+)", content, re.DOTALL)
-    if notes_match:
-        result["teacher_notes"] = notes_match.group(1).strip()
+    # Teacher notes run to the end of the document; split them off first so
+    # the line loop below never walks the notes prose
+    notes = _NOTES_HEADING_RE.search(content)
+    if notes:
+        result["teacher_notes"] = content[notes.end():].strip()
+        content = content[:notes.start()]
+
+    lines = content.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+
+        heading = _QUESTION_HEADING_RE.fullmatch(line)
+        if heading:
+            question, i = _read_question(lines, i)
+            if question:
+                result["questions"].append({"number": int(heading.group(1)), **question})
+            continue
+
+        answers = _ANSWER_RE.findall(line) if "|" in line else ()
+        for a in answers:
+            result["answer_key"].append({
+                "question": int(a[0]),
+                "answer": a[1],
+                "explanation": a[2].strip()
+            })
+        if not answers:
+            for key, marker in (
+                ("title", _TITLE_MARKER),
+                ("text_name", _TEXT_MARKER),
+                ("year_level", _YEAR_MARKER),
+            ):
+                _, found, value = line.partition(marker)
+                if found and value and not result[key]:
+                    result[key] = value.strip()
+                    break
 
     return result
 
 
-def create_quiz_docx(quiz_data: Dict, year_level: str, text_name: str) -> BytesIO:
+def _read_question(lines: List[str], start: int):
+    """
+    Read a question's stem and options, starting just below its heading.
+
+    The stem runs to the first "A) " line. Options A-C each run to the next
+    option's line; D runs to a blank line, a "---" rule or a heading.
+
+    Returns:
+        (question, next_index): the question's text and options with the index
+        of the line after option D, or (None, start) if the lines that follow
+        are not a complete question.
+    """
+    i = start
+    while i < len(lines) and not lines[i].startswith(_OPTION_PREFIXES[0][1]):
+        if _ends_question(lines[i]):
+            return None, start
+        i += 1
+    stem = "\n".join(lines[start:i]).strip()
+    if not stem or i == len(lines):
+        return None, start
+
+    options = {}
+    for n, (letter, prefix) in enumerate(_OPTION_PREFIXES):
+        next_prefix = _OPTION_PREFIXES[n + 1][1] if n + 1 < len(_OPTION_PREFIXES) else None
+        option_start = i
+        i += 1
+        while i < len(lines):
+            line = lines[i]
+            if next_prefix and line.startswith(next_prefix):
+                break
+            if _ends_question(line) or (not next_prefix and not line.strip()):
+                break
+            i += 1
+        if next_prefix and (i == len(lines) or not lines[i].startswith(next_prefix)):
+            return None, start
+        text = "\n".join([lines[option_start][len(prefix):], *lines[option_start + 1:i]]).strip()
+        if not text:
+            return None, start
+        options[letter] = text
+
+    return {"text": stem, "options": options}, i
+
+
+def _ends_question(line: str) -> bool:
+    """True for a line that closes a question block: a "---" rule or heading."""
+    return line.startswith("---") or line.startswith("#")
+
+
+def create_quiz_docx(quiz_data: Dict, year_level: str, text_name: str) -> SpooledTemporaryFile:
     """
     Create a DOCX file from parsed quiz data.
 
@@ -185,14 +412,27 @@ def create_quiz_docx(quiz_data: Dict, year_level: str, text_name: str) -> BytesI
         text_name: Text name for header.
 
     Returns:
-        BytesIO object containing the DOCX file.
+        Rewound file-like object containing the DOCX file.
     """
-    # Create document
-    doc = setup_document(colour_scheme='professional_minimal')
+    # python-docx/lxml and the prebuilt style templates load on first use,
+    # not when a page imports this module
+    from docx_generation.docx_styles import (
+        setup_document_with_header,
+        add_title,
+        add_subtitle,
+        add_subsection_heading,
+        add_question,
+        add_option,
+        add_body_paragraph,
+        add_content_table,
+        add_horizontal_rule,
+        add_page_break,
+        save_document_to_stream
+    )
 
-    # Add header/footer
-    add_header_footer(
-        doc,
+    # Create document with header/footer (cloned from a cached template)
+    doc = setup_document_with_header(
+        colour_scheme='professional_minimal',
         year_level=year_level,
         unit_name=text_name,
         doc_type="Quiz",
@@ -210,16 +450,10 @@ def create_quiz_docx(quiz_data: Dict, year_level: str, text_name: str) -> BytesI
         # Add question
         add_question(doc, q["number"], q["text"])
 
-        # Add options
-        for letter, option_text in q.get("options", {}).items():
-            para = doc.add_paragraph()
-            para.paragraph_format.left_indent = 635000  # ~0.5 inch
-            run = para.add_run(f"{letter}) {option_text}")
-            run.font.name = "Aptos"
-            run.font.size = 132000  # 11pt in EMUs
-
-        # Add spacing
-        doc.add_paragraph()
+        # Add options; the last one carries the space before the next question
+        options = q.get("options", {})
+        for i, (letter, option_text) in enumerate(options.items(), 1):
+            add_option(doc, letter, option_text, last=i == len(options))
 
     # Add page break before answer key
     add_page_break(doc)
@@ -246,20 +480,61 @@ def create_quiz_docx(quiz_data: Dict, year_level: str, text_name: str) -> BytesI
         add_subsection_heading(doc, "Teacher Notes")
         add_body_paragraph(doc, quiz_data["teacher_notes"])
 
-    # Save to BytesIO
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
+    # Save to a spooled stream (spills to disk for very large documents)
+    return save_document_to_stream(doc)
+
 
-    return buffer
+def _docx_format_key() -> str:
+    """Fingerprint of the code that lays out quiz documents."""
+    root = Path(__file__).parent.parent
+    digest = hashlib.sha256()
+    for source in (root / "docx_generation" / "docx_styles.py", Path(__file__)):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# Part of the build_quiz_docx_bytes() cache key, so a deploy that changes
+# the document layout never serves bytes persisted by the previous one.
+DOCX_FORMAT_KEY = _docx_format_key()
+
+
+@st.cache_data(show_spinner=False, max_entries=32, persist="disk")
+def build_quiz_docx_bytes(
+    quiz_data: Dict,
+    year_level: str,
+    text_name: str,
+    format_key: str = DOCX_FORMAT_KEY
+) -> bytes:
+    """
+    Build the quiz DOCX and return its bytes, cached on the inputs.
+
+    Streamlit reruns the page script on every widget interaction; caching on
+    the parsed quiz data means identical inputs skip python-docx assembly.
+    Entries persist to disk (persisted caches have no TTL in Streamlit), so
+    they also survive container restarts. Streamlit only hashes this
+    function's own source, so format_key carries the layout code's version
+    into the key.
+
+    Args:
+        quiz_data: Parsed quiz dictionary.
+        year_level: Year level for header.
+        text_name: Text name for header.
+        format_key: Layout fingerprint; callers pass DOCX_FORMAT_KEY.
+
+    Returns:
+        The DOCX file contents.
+    """
+    with create_quiz_docx(quiz_data, year_level, text_name) as stream:
+        return stream.read()
 
 
 def generate_quiz_docx(
     year_level: str,
     text_id: str,
     topic: str,
-    num_questions: int = 10
-) -> tuple[BytesIO, str]:
+    num_questions: int = 10,
+    nonce: int = 0
+) -> tuple[bytes, str]:
     """
     Generate a complete quiz DOCX file.
 
@@ -268,9 +543,10 @@ def generate_quiz_docx(
         text_id: Text ID from index.
         topic: Quiz topic.
         num_questions: Number of questions.
+        nonce: Change to bypass the shared generation cache.
 
     Returns:
-        Tuple of (BytesIO docx file, raw markdown content).
+        Tuple of (docx file bytes, raw markdown content).
     """
     # Get text info
     text_info = get_text_info(text_id)
@@ -278,7 +554,110 @@ def generate_quiz_docx(
         raise ValueError(f"Text not found: {text_id}")
 
     # Generate quiz content
-    raw_content = generate_quiz(year_level, text_id, topic, num_questions)
+    raw_content = generate_quiz(
+        year_level,
+        text_info,
+        topic,
+        num_questions,
+        prompt_template=load_quiz_prompt(),
+        nonce=nonce
+    )
+
+    return quiz_docx_from_content(raw_content, year_level, text_id, topic), raw_content
+
+
+def stream_quiz(
+    year_level: str,
+    text_id: str,
+    topic: str,
+    num_questions: int = 10,
+    nonce: int = 0
+) -> Iterator[str]:
+    """
+    Start generating a quiz and return its markdown as it arrives.
+
+    Suitable for st.write_stream(); pass the joined text to
+    quiz_docx_from_content() once the stream is exhausted. A quiz already
+    generated for the same request (and nonce) is returned as one chunk.
+
+    Args:
+        year_level: Year level.
+        text_id: Text ID from index.
+        topic: Quiz topic.
+        num_questions: Number of questions.
+        nonce: Change to bypass the shared generation cache.
+
+    Returns:
+        Iterator over chunks of the generated markdown, in order.
+    """
+    text_info = get_text_info(text_id)
+    if not text_info:
+        raise ValueError(f"Text not found: {text_id}")
+
+    prompt = build_quiz_prompt(
+        year_level,
+        text_info,
+        topic,
+        num_questions,
+        load_quiz_prompt()
+    )
+
+    return _cached_generate_stream(prompt, max_tokens=4000, temperature=0.7, nonce=nonce)
+
+
+def quiz_docx_from_content(
+    raw_content: str,
+    year_level: str,
+    text_id: str,
+    topic: str
+) -> bytes:
+    """
+    Parse generated quiz markdown and build its DOCX.
+
+    Args:
+        raw_content: Complete markdown returned by the model.
+        year_level: Year level.
+        text_id: Text ID from index.
+        topic: Quiz topic (used as the title if the content has none).
+
+    Returns:
+        The DOCX file contents.
+
+    Raises:
+        GenerationError: If no questions could be parsed.
+    """
+    return quiz_docx_builder(raw_content, year_level, text_id, topic)()
+
+
+def quiz_docx_builder(
+    raw_content: str,
+    year_level: str,
+    text_id: str,
+    topic: str
+) -> Callable[[], bytes]:
+    """
+    Parse generated quiz markdown now and defer building its DOCX.
+
+    Parsing errors surface immediately; the returned callable holds only the
+    parsed quiz data and builds the file when called, so it can be handed to
+    st.download_button(data=...) instead of keeping DOCX bytes in session
+    state.
+
+    Args:
+        raw_content: Complete markdown returned by the model.
+        year_level: Year level.
+        text_id: Text ID from index.
+        topic: Quiz topic (used as the title if the content has none).
+
+    Returns:
+        A no-argument callable returning the DOCX file contents.
+
+    Raises:
+        GenerationError: If no questions could be parsed.
+    """
+    text_info = get_text_info(text_id)
+    if not text_info:
+        raise ValueError(f"Text not found: {text_id}")
 
     # Parse content
     quiz_data = parse_quiz_content(raw_content)
@@ -293,11 +672,11 @@ def generate_quiz_docx(
             "check the preview for issues."
         )
 
-    # Create DOCX
-    docx_buffer = create_quiz_docx(
+    # Create DOCX on demand
+    return functools.partial(
+        build_quiz_docx_bytes,
         quiz_data,
         year_level=f"Year {year_level}",
-        text_name=text_info["name"]
+        text_name=text_info["name"],
+        format_key=DOCX_FORMAT_KEY
     )
-
-    return docx_buffer, raw_content
@@ -5,13 +5,12 @@ Main page for generating teaching resources.
 """
 
 import json
+import random
 from pathlib import Path
 
 import streamlit as st
 
 from utils.auth import check_authentication
-from generators.quiz_generator import generate_quiz_docx, load_text_index
-from generators.llm_client import RateLimitError, ContentFilterError, GenerationError
 
 
 # Page config
@@ -29,6 +28,13 @@ def main():
         st.switch_page("app.py")
         return
 
+    # Only import generator code once the user is authenticated. The Gemini
+    # SDK and python-docx/lxml load later still, on first generation.
+    from generators.quiz_generator import (
+        get_text_info, load_text_index, quiz_docx_builder, stream_quiz, texts_by_year
+    )
+    from generators.llm_client import RateLimitError, ContentFilterError, GenerationError
+
     st.title("📝 Generate Resource")
 
     # Load text index
@@ -55,8 +61,8 @@ def main():
             format_func=lambda x: year_options[x]
         )
 
-    # Filter texts by year level
-    available_texts = [t for t in index["texts"] if t["year"] == selected_year]
+    # Texts for the selected year level (grouped once, cached across reruns)
+    available_texts = texts_by_year().get(selected_year, [])
 
     with col2:
         if available_texts:
@@ -89,7 +95,7 @@ def main():
         )
 
         # Get text info for display
-        text_info = next((t for t in available_texts if t["id"] == selected_text), None)
+        text_info = get_text_info(selected_text)
 
         if text_info:
             with st.expander("Available Knowledge Base Resources"):
@@ -100,21 +106,47 @@ def main():
         # Generate button
         st.subheader("4. Generate")
 
+        force_fresh = st.checkbox(
+            "Force regenerate (bypass cache)",
+            help="Identical requests reuse a quiz generated in the last day. "
+                 "Tick to always ask for a new one."
+        )
+
         if st.button("🚀 Generate Quiz", type="primary", use_container_width=True):
             if not topic:
                 st.error("Please enter a topic for the quiz.")
             else:
+                year_level = selected_year.replace("F", " Fundamentals")
+                # Show the quiz as it is written, then swap the live view for
+                # the download/preview section once it has been parsed
+                live_preview = st.empty()
                 with st.spinner("Generating quiz... This may take 30-60 seconds."):
                     try:
-                        docx_buffer, raw_content = generate_quiz_docx(
-                            year_level=selected_year.replace("F", " Fundamentals"),
+                        with live_preview.container(border=True):
+                            raw_content = st.write_stream(stream_quiz(
+                                year_level=year_level,
+                                text_id=selected_text,
+                                topic=topic,
+                                num_questions=num_questions,
+                                nonce=(
+                                    random.getrandbits(32) if force_fresh
+                                    else st.session_state.get("generation_nonce", 0)
+                                )
+                            ))
+                        build_docx = quiz_docx_builder(
+                            raw_content,
+                            year_level=year_level,
                             text_id=selected_text,
-                            topic=topic,
-                            num_questions=num_questions
+                            topic=topic
                         )
-
-                        # Store in session state
-                        st.session_state.generated_docx = docx_buffer
+                        live_preview.empty()
+                        # A Regenerate nonce covers one generation only, so
+                        # later quizzes share the cache again
+                        st.session_state.pop("generation_nonce", None)
+
+                        # Store in session state. Only the parsed quiz is kept;
+                        # the DOCX is built when Download is clicked.
+                        st.session_state.generated_docx = build_docx
                         st.session_state.generated_content = raw_content
                         st.session_state.generated_filename = (
                             f"Year{selected_year}_{text_info['name'].replace(' ', '_')}"
@@ -149,7 +181,8 @@ def main():
 
             with col2:
                 if st.button("🔄 Regenerate", use_container_width=True):
-                    # Clear and regenerate
+                    # Clear and regenerate, skipping the cached quiz
+                    st.session_state.generation_nonce = random.getrandbits(32)
                     st.session_state.pop("generated_docx", None)
                     st.session_state.pop("generated_content", None)
                     st.rerun()
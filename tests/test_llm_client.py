@@ -0,0 +1,120 @@
+"""
+Tests for the Gemini client's error classification and retry behaviour.
+
+The model is replaced with a stub that returns real SDK response objects, so
+the errors come from google.generativeai itself; no API key or network is
+needed.
+"""
+
+import unittest
+from unittest import mock
+
+from google.api_core import exceptions as api_exceptions
+import google.generativeai as genai
+from google.generativeai import protos
+
+from generators.llm_client import (
+    MAX_ATTEMPTS,
+    ContentFilterError,
+    GeminiClient,
+    GenerationError,
+    RateLimitError,
+    _classify_error,
+)
+
+FinishReason = protos.Candidate.FinishReason
+
+
+def _response(text=None, finish_reason=FinishReason.STOP):
+    """Build an SDK response with one candidate, empty unless text is given."""
+    content = {"parts": [{"text": text}]} if text is not None else {}
+    return genai.types.GenerateContentResponse.from_response(
+        protos.GenerateContentResponse(candidates=[
+            protos.Candidate(content=content, finish_reason=finish_reason)
+        ])
+    )
+
+
+class _StubModel:
+    """Plays back one outcome per generate_content() call."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        outcome = self.outcomes[self.calls]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _client(model):
+    client = GeminiClient.__new__(GeminiClient)
+    client.model = model
+    return client
+
+
+class ClassifyErrorTests(unittest.TestCase):
+
+    def test_finish_reason_link_is_not_a_rate_limit(self):
+        with self.assertRaises(ValueError) as raised:
+            _response(finish_reason=FinishReason.MAX_TOKENS).text
+        self.assertIsInstance(_classify_error(raised.exception), GenerationError)
+
+    def test_prohibited_content_is_filtered(self):
+        with self.assertRaises(ValueError) as raised:
+            _response(finish_reason=FinishReason.PROHIBITED_CONTENT).text
+        self.assertIsInstance(_classify_error(raised.exception), ContentFilterError)
+
+    def test_resource_exhausted_is_a_rate_limit(self):
+        error = api_exceptions.ResourceExhausted("Resource has been exhausted")
+        self.assertIsInstance(_classify_error(error), RateLimitError)
+
+
+@mock.patch("generators.llm_client.time.sleep")
+class GenerateTests(unittest.TestCase):
+
+    def test_safety_block_is_not_retried(self, sleep):
+        model = _StubModel(_response(finish_reason=FinishReason.SAFETY))
+        with self.assertRaises(ContentFilterError):
+            _client(model).generate("prompt")
+        self.assertEqual(model.calls, 1)
+        sleep.assert_not_called()
+
+    def test_rate_limit_is_retried(self, sleep):
+        model = _StubModel(api_exceptions.ResourceExhausted("quota"), _response("ok"))
+        self.assertEqual(_client(model).generate("prompt"), "ok")
+        self.assertEqual(model.calls, 2)
+        sleep.assert_called_once()
+
+
+@mock.patch("generators.llm_client.time.sleep")
+class GenerateStreamTests(unittest.TestCase):
+
+    def test_safety_block_before_first_chunk_is_not_retried(self, sleep):
+        model = _StubModel([_response(finish_reason=FinishReason.SAFETY)])
+        with self.assertRaises(ContentFilterError):
+            list(_client(model).generate_stream("prompt"))
+        self.assertEqual(model.calls, 1)
+        sleep.assert_not_called()
+
+    def test_rate_limit_before_first_chunk_is_retried(self, sleep):
+        model = _StubModel(
+            api_exceptions.ResourceExhausted("quota"),
+            [_response("a"), _response("b")],
+        )
+        self.assertEqual(list(_client(model).generate_stream("prompt")), ["a", "b"])
+        self.assertEqual(model.calls, 2)
+        sleep.assert_called_once()
+
+    def test_rate_limit_gives_up_after_max_attempts(self, sleep):
+        model = _StubModel(*[api_exceptions.ResourceExhausted("quota")] * MAX_ATTEMPTS)
+        with self.assertRaises(RateLimitError):
+            list(_client(model).generate_stream("prompt"))
+        self.assertEqual(model.calls, MAX_ATTEMPTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
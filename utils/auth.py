@@ -21,6 +21,17 @@ def get_allowed_emails() -> List[str]:
         return ["demo@example.com"]
 
 
+@st.cache_resource(show_spinner=False, ttl=300)
+def _allowed_email_set() -> frozenset:
+    """
+    Normalised allowlist for membership checks, shared across sessions.
+
+    Refreshed every five minutes so edits to the secrets file take effect
+    without a restart.
+    """
+    return frozenset(e.strip().lower() for e in get_allowed_emails())
+
+
 def get_cookie_key() -> str:
     """Get cookie key from secrets."""
     try:
@@ -33,6 +44,10 @@ def check_authentication() -> bool:
     """
     Check if the current user is authenticated.
 
+    This is a per-session dict lookup with no external round trip, so it is
+    deliberately not wrapped in st.cache_data: that cache is shared across
+    all sessions and would leak one user's login state to another.
+
     Returns:
         True if user is authenticated, False otherwise.
     """
@@ -50,9 +65,8 @@ def authenticate_user(email: str) -> bool:
         True if authentication successful, False otherwise.
     """
     email = email.strip().lower()
-    allowed_emails = [e.lower() for e in get_allowed_emails()]
 
-    if email in allowed_emails:
+    if email in _allowed_email_set():
         st.session_state.authenticated = True
         st.session_state.user_email = email
         st.session_state.login_time = time.time()